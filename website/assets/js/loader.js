@@ -91,6 +91,25 @@ function update_loader_message(message) {
     console.log(message)
 }
 
+// Called by main.py once the page can be used.
+// The time to interactive is counted from the start of the navigation.
+// It is shown in a footer, as the loading blocker is removed right after.
+function report_time_to_interactive() {
+    const ms = Math.round(performance.now());
+    window.time_to_interactive_ms = ms;
+    console.log("Time to interactive: " + ms + " ms")
+    let footer = document.getElementById('time_to_interactive');
+    if (!footer) {
+        footer = document.createElement("p");
+        Object.assign(footer, {
+          id: 'time_to_interactive',
+           className : 'grey-text center-align'
+        })
+        document.body.appendChild(footer);
+    }
+    footer.innerHTML = "Ready in " + ms + " ms";
+}
+
 // Add event listener to run 1x when brython is all done to remove our blocker and its css style tag.
 document.addEventListener("brython_done", function (e) {
     console.log("Started loader clean up")
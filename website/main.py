@@ -1,8 +1,31 @@
-from browser import document, html, window, alert, console, bind  # type: ignore
-import random
+from browser import document, html, window, alert, console, bind, ajax  # type: ignore
 
-from sudoku_solver import SudokuBoard, SudokuSolver
-from sudoku_generator import SudokuGenerator
+from sudoku_solver import BitmaskSudokuBoard, SudokuSolver, SolutionCache
+from sudoku_bank import PuzzleBank
+from sudoku_symmetry import SudokuTransform
+from sudoku_worker_client import SudokuWorkerClient
+
+PUZZLE_BANK_URL = "puzzle_bank.txt"
+
+
+class MathRandom:
+    """The part of random.Random used by the page, from window.Math.random(),
+    as importing the random module slows the page down.
+    """
+
+    def random(self):
+        return window.Math.random()
+
+    def randrange(self, n):
+        return int(window.Math.random() * n)
+
+    def shuffle(self, x):
+        for i in range(len(x) - 1, 0, -1):
+            j = self.randrange(i + 1)
+            x[i], x[j] = x[j], x[i]
+
+
+rng = MathRandom()
 
 
 def main():
@@ -35,10 +58,10 @@ def main():
     document <= html.P()
     document <= html.DIV(Class="row") <= html.DIV(Class="container") <= rbs_levels
 
+    # Filled in the background after startup, see load_puzzle_bank().
+    puzzle_bank = None
+
     def generate_puzzle(ev):
-        nonlocal generated_sdm
-        puzzle.clear()
-        alert("It could take some time to generate a new puzzle.")
         if rb_beginner.checked:
             level = 46
         elif rb_easy.checked:
@@ -51,18 +74,140 @@ def main():
             level = 17
         else:
             level = 46
-        generated_sdm = SudokuGenerator().generate_level(level=level).get_sdm()
-        puzzle <= make_grid(generated_sdm)
+        if puzzle_bank is not None and puzzle_bank.get_num_puzzles(level):
+            # A random variant of a bank puzzle, as hard as it but rarely seen before.
+            sdm = puzzle_bank.sample(level, rng)
+            transform = SudokuTransform.random(rng)
+            variant_sdm = transform.apply(sdm)
+            solution_sdm = puzzle_bank.get_solution(sdm)
+            if solution_sdm is not None:
+                solution_cache.put(variant_sdm, transform.apply(solution_sdm))
+            show_generated(variant_sdm)
+        else:
+            # Generate in the web worker, so that the page stays responsive.
+            sudoku_worker.generate(
+                level,
+                on_result=show_generated,
+                on_progress=show_generate_progress,
+                on_error=lambda message: generate_in_page(level, message),
+            )
+            update_worker_status()
+
+    def generate_in_page(level, message):
+        """Generate on the UI thread if the worker is not available."""
+        if sudoku_worker.is_available():
+            show_worker_error(message)
+            return
+        console.log(message)
+        # Imported here, as it is only needed without the worker.
+        from sudoku_generator import SudokuGenerator
+
+        alert("It could take some time to generate a new puzzle.")
+        board = SudokuGenerator(cache=solution_cache).generate_level(level=level)
+        show_generated(board.get_sdm())
+
+    def show_generated(sdm):
+        nonlocal generated_sdm
+        generated_sdm = sdm
+        update_grid(generated_sdm)
         btn_generate.disabled = True
+        update_worker_status()
+
+    def show_generate_progress(num_clues):
+        worker_status.text = f"Generating a new puzzle... {num_clues} clues left."
+
+    def show_worker_error(message):
+        console.log(message)
+        update_worker_status()
+        alert("Sorry, something went wrong.")
+
+    def update_worker_status():
+        num_pending_jobs = sudoku_worker.get_num_pending_jobs()
+        btn_cancel.disabled = not num_pending_jobs
+        if num_pending_jobs:
+            worker_status.text = f"Working on {num_pending_jobs} job(s)..."
+        else:
+            worker_status.text = ""
+
+    def cancel_jobs(ev):
+        sudoku_worker.cancel()
+        update_worker_status()
+
+    sudoku_worker = SudokuWorkerClient()
 
     btn_generate = html.BUTTON(
         "Generate", Class="btn waves-effect waves-light", disabled=True
     )
     btn_generate.bind("click", generate_puzzle)
-    document <= html.DIV(Class="row") <= html.DIV(Class="container") <= btn_generate
+    btn_cancel = html.BUTTON(
+        "Cancel", Class="btn waves-effect waves-light", disabled=True
+    )
+    btn_cancel.bind("click", cancel_jobs)
+    worker_status = html.SPAN()
+    document <= html.DIV(Class="row") <= html.DIV(Class="container") <= [
+        btn_generate,
+        " ",
+        btn_cancel,
+        " ",
+        worker_status,
+    ]
 
     current_cell = None
 
+    # The grid is built once by make_grid(). update_grid() then writes only
+    # the cells that change, comparing with what is cached here,
+    # so the DOM is never read back nor rebuilt.
+    cells = []  # The 81 TD elements.
+    cell_texts = [None] * 81
+    cell_givens = [None] * 81
+    cell_conflicts = [False] * 81
+
+    # The board shown, updated cell by cell as values are entered.
+    # Its unit counts make the solved and conflict checks O(1) per unit,
+    # and its bitmasks give the candidates of a cell.
+    board = BitmaskSudokuBoard("0" * 81)
+    conflict_units = set()  # Units with a value used more than once.
+
+    def update_cell_class(i):
+        classes = []
+        if cell_givens[i]:
+            classes.append("grey lighten-2")
+        if cell_conflicts[i]:
+            classes.append("red-text")
+        cells[i].attrs["class"] = " ".join(classes)
+
+    def update_conflicts(units):
+        """Recheck the units and highlight all the cells of those with conflicts."""
+        for u in units:
+            if max(board.unit_counts[u]) > 1:
+                conflict_units.add(u)
+            else:
+                conflict_units.discard(u)
+        in_conflict = {
+            r * 9 + c for u in conflict_units for r, c in SudokuSolver.UNITS[u]
+        }
+        for i in range(81):
+            if cell_conflicts[i] != (i in in_conflict):
+                cell_conflicts[i] = i in in_conflict
+                update_cell_class(i)
+
+    def enter_value(i, value):
+        """Enter the value typed into cell i, or empty it if it is not a digit."""
+        val = int(value[-1]) if value and value[-1].isdigit() else 0
+        r, c = divmod(i, 9)
+        board.set_cell(r, c, val)
+        set_cell_text(i, str(val) if val else " ")
+        update_conflicts(board.UNIT_NUMS[r][c])
+
+    def set_cell_text(i, text):
+        nonlocal current_cell
+        cell = cells[i]
+        cell.clear()
+        cell.text = text
+        cell_texts[i] = text
+        if current_cell is not None and current_cell.id == cell.id:
+            current_cell = None
+
     def entry_keypress(ev):
         ev.preventDefault()
         ev.stopPropagation()
@@ -71,21 +216,16 @@ def main():
         if is_digit:
             value = ev.key
             cell = ev.target.parent
-            cell.clear()
-            cell.text = value
-
-            sdm = "".join(
-                cell.text or " " for cell in puzzle.get(selector="TD")
-            ).replace(" ", "0")
-            print(sdm)
-            if SudokuBoard(sdm).is_solved():
+            enter_value(int(cell.id[1:]), value)
+
+            if board.is_solved():
                 solve(None)
                 alert("The puzzle is solved.")
 
             # jump to next cell
             # cell_rank = int(cell.id[1:])
             # if cell_rank < 80:
-            #     next_cell = puzzle.get(selector="TD")[cell_rank + 1]
+            #     next_cell = cells[cell_rank + 1]
             #     make_input(next_cell)
 
     def entry_keydown(ev):
@@ -95,18 +235,17 @@ def main():
             ev.stopPropagation()
             value = ev.target.value
             cell = ev.target.parent
-            cell.clear()
-            cell.text = value
+            cell_rank = int(cell.id[1:])
+            enter_value(cell_rank, value)
 
             # jump to next cell
-            cell_rank = int(cell.id[1:])
             if not ev.shiftKey:
                 if cell_rank < 80:
-                    next_cell = puzzle.get(selector="TD")[cell_rank + 1]
+                    next_cell = cells[cell_rank + 1]
                     make_input(next_cell)
             else:  # shift tab
                 if cell_rank > 0:
-                    next_cell = puzzle.get(selector="TD")[cell_rank - 1]
+                    next_cell = cells[cell_rank - 1]
                     make_input(next_cell)
 
     def end_entry(ev):
@@ -114,13 +253,16 @@ def main():
         if current_cell is not None:
             inputs = current_cell.get(selector="INPUT")
             if inputs:
-                value = inputs[0].value
-                current_cell.clear()
-                current_cell.text = value
+                enter_value(int(current_cell.id[1:]), inputs[0].value)
 
     def entry(ev):
+        cell = ev.currentTarget
+        if cell_givens[int(cell.id[1:])] or (
+            current_cell is not None and current_cell.id == cell.id
+        ):
+            return
         end_entry(ev)
-        make_input(ev.target)
+        make_input(cell)
 
     def entry_blur(ev):
         end_entry(ev)
@@ -128,8 +270,14 @@ def main():
     def make_input(cell):
         nonlocal current_cell
         value = cell.text.strip()
+        i = int(cell.id[1:])
         cell.clear()
+        cell_texts[i] = None  # It holds the INPUT now.
         input = html.INPUT(value=value, style={"width": "1.3em", "padding": "0px"})
+        # Pencil marks: the candidates of the cell, as a tooltip.
+        possible_set = board.get_possible_set(*divmod(i, 9))
+        if possible_set:
+            input.title = " ".join(str(val) for val in sorted(possible_set))
         cell <= input
         # input.bind("keydown", entry_keydown)
         input.bind("keypress", entry_keypress)
@@ -137,78 +285,116 @@ def main():
         input.select()
         current_cell = cell
 
-    def make_grid(grid):
-        # returns an HTML table with 9 rows and 9 columns
-        nonlocal current_cell
-
+    def make_grid():
+        # returns an HTML table with 9 rows and 9 columns, filled by update_grid()
         t = html.TABLE()
         for i in range(3):
             cg = html.COLGROUP()
             for j in range(3):
                 cg <= html.COL()
             t <= cg
-        srow = -1
-        for i, val in enumerate(grid):
-            row, column = divmod(i, 9)
-            if row > srow:
-                if row % 3 == 0:
-                    tb = html.TBODY()
-                    t <= tb
-                line = html.TR()
-                tb <= line
-                srow = row
-            if val == "0":
-                val = " "
-                cell = html.TD(val, id="i%s" % i)
+        for row in range(9):
+            if row % 3 == 0:
+                tb = html.TBODY()
+                t <= tb
+            line = html.TR()
+            tb <= line
+            for column in range(9):
+                cell = html.TD(id="i%s" % (row * 9 + column))
                 cell.bind("click", entry)
-                cell.style.contentEditable = True
-            else:
-                cell = html.TD(val, id="i%s" % i, Class="grey lighten-2")
-                cell.style.contentEditable = False
-            if column % 3 == 0:
-                cell.style.borderLeftWidth = "1px"
-            if column == 8:
-                cell.style.borderRightWidth = "1px"
-            line <= cell
+                if column % 3 == 0:
+                    cell.style.borderLeftWidth = "1px"
+                if column == 8:
+                    cell.style.borderRightWidth = "1px"
+                line <= cell
+                cells.append(cell)
+        return t
 
+    def update_grid(grid):
+        """Show the sdm grid. Its clues are given and cannot be edited."""
+        nonlocal current_cell, board
         current_cell = None
-        return t
+        board = BitmaskSudokuBoard(grid)
+        for i, val in enumerate(grid):
+            given = val != "0"
+            if given != cell_givens[i]:
+                cell_givens[i] = given
+                cells[i].style.contentEditable = not given
+                update_cell_class(i)
+            text = val if given else " "
+            if text != cell_texts[i]:
+                set_cell_text(i, text)
+        update_conflicts(range(27))
 
     puzzle = html.SPAN(Class="left")
     # generated_sdm = SudokuGenerator().generate_level(level=SudokuGenerator.BEGINNER).get_sdm()
-    generated_sdm = random.choice(
-        [
-            "001980600406020810582640037200009703319070008860230091020150376100460250653702100",
-            "568004090310589206094000051739152000481076020652948700845001002106803075003020008",
-            "140608309930140002080203040000060914201700506564981270716050028420800735300420000",
-            "005601042700090000321000000819046230000300500053917684108704309097283416030169875",
-            "000149250046250900502076041025030607067890005800700302680500739203980064079000028",
-            "009000346804203790631040285213680900080700403900135608000090102470012500100506034",
-            "683105097014780062027003500001950603000310045360874210200067030478230050130590004",
-            "145008206086024503020756100007240651562001700419507300090600005671095000354010960",
-            "600280309803706020007030840578492630030070052426500790980350004702804903300009587",
-            "901420067000000203087063501000600904863509070000231085128794356079352018300186020",
-            "100040683048500709607013020060090050479251036010786002930170268200630470750020301",
-            "080051096901700280265480107009864702412903560800020000627310900098542603300090020",
-            "539102876048065120260837000092006438380200960076309250620490000000020004004070382",
-            "709563402803724510520000736205970800070402903000306027080005370001240690697030005",
-            "753008600086190527009007480372049100890016200600302090567901042038670051040085306",
-            "205876104014052087900043005700310950003504760102090040401239070500781030007465019",
-            "049000106028060470050700809064325900007890564905006310502683701073910000010547290",
-            "008605014471200060609140230584003020000050349903064001840500173015380092092001080",
-            "173045860590008741800097000420800657015076980600050403004031598900004100051600230",
-            "781204506000038197903016200208607010000321869000980002000009708017402953540870621",
-        ]
-    )
-    puzzle <= make_grid(generated_sdm)
+    startup_sdms = [
+        "001980600406020810582640037200009703319070008860230091020150376100460250653702100",
+        "568004090310589206094000051739152000481076020652948700845001002106803075003020008",
+        "140608309930140002080203040000060914201700506564981270716050028420800735300420000",
+        "005601042700090000321000000819046230000300500053917684108704309097283416030169875",
+        "000149250046250900502076041025030607067890005800700302680500739203980064079000028",
+        "009000346804203790631040285213680900080700403900135608000090102470012500100506034",
+        "683105097014780062027003500001950603000310045360874210200067030478230050130590004",
+        "145008206086024503020756100007240651562001700419507300090600005671095000354010960",
+        "600280309803706020007030840578492630030070052426500790980350004702804903300009587",
+        "901420067000000203087063501000600904863509070000231085128794356079352018300186020",
+        "100040683048500709607013020060090050479251036010786002930170268200630470750020301",
+        "080051096901700280265480107009864702412903560800020000627310900098542603300090020",
+        "539102876048065120260837000092006438380200960076309250620490000000020004004070382",
+        "709563402803724510520000736205970800070402903000306027080005370001240690697030005",
+        "753008600086190527009007480372049100890016200600302090567901042038670051040085306",
+        "205876104014052087900043005700310950003504760102090040401239070500781030007465019",
+        "049000106028060470050700809064325900007890564905006310502683701073910000010547290",
+        "008605014471200060609140230584003020000050349903064001840500173015380092092001080",
+        "173045860590008741800097000420800657015076980600050403004031598900004100051600230",
+        "781204506000038197903016200208607010000321869000980002000009708017402953540870621",
+    ]
+    generated_sdm = startup_sdms[rng.randrange(len(startup_sdms))]
+    puzzle <= make_grid()
+    update_grid(generated_sdm)
     document <= html.P()
     document <= html.DIV(Class="row") <= html.DIV(Class="container") <= puzzle
 
+    # Solutions of the puzzles solved so far, so that solving them again is instant.
+    solution_cache = SolutionCache()
+
     def solve(ev):
-        solution_board = SudokuSolver().get_1_solution(SudokuBoard(generated_sdm))
-        puzzle.clear()
-        puzzle <= make_grid(solution_board.get_sdm())
+        puzzle_sdm = generated_sdm
+        solution_sdm = solution_cache.get(puzzle_sdm)
+        if solution_sdm is not None:
+            show_solution(solution_sdm)
+            return
+
+        def cache_solution(sdm):
+            if sdm is not None:
+                solution_cache.put(puzzle_sdm, sdm)
+            # Jobs run in order, so a puzzle generated meanwhile may have replaced it.
+            if puzzle_sdm == generated_sdm:
+                show_solution(sdm)
+            else:
+                update_worker_status()
+
+        sudoku_worker.solve(
+            puzzle_sdm, on_result=cache_solution, on_error=solve_in_page
+        )
+        update_worker_status()
+
+    def solve_in_page(message):
+        console.log(message)
+        solution_board = SudokuSolver(cache=solution_cache).get_1_solution(
+            BitmaskSudokuBoard(generated_sdm)
+        )
+        show_solution(None if solution_board is None else solution_board.get_sdm())
+
+    def show_solution(sdm):
+        if sdm is None:
+            update_worker_status()
+            alert("The puzzle has no solution.")
+            return
+        update_grid(sdm)
         btn_generate.disabled = False
+        update_worker_status()
 
     btn_solve = html.BUTTON("Solve", Class="btn waves-effect waves-light")
     btn_solve.bind("click", solve)
@@ -216,6 +402,17 @@ def main():
 
     # Must do window.M.AutoInit() after all html being loaded!
     window.M.AutoInit()
+    window.report_time_to_interactive()
+
+    def load_puzzle_bank(req):
+        nonlocal puzzle_bank
+        # Status 0 is for pages opened from the file system.
+        if req.status in (0, 200) and req.text:
+            puzzle_bank = PuzzleBank(req.text)
+        else:
+            console.log(f"Failed to load {PUZZLE_BANK_URL}: {req.status}")
+
+    ajax.get(PUZZLE_BANK_URL, mode="text", oncomplete=load_puzzle_bank)
 
 
 if __name__ == "__main__":
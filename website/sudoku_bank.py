@@ -0,0 +1,84 @@
+"""Sudoku Puzzle Bank.
+
+Puzzles generated offline, indexed by level and number of clues,
+so that the web page can draw one instantly instead of generating it.
+
+Bank text format, 1 puzzle per line: level, number of clues, sdm
+and the sdm of its solution, so that solving a bank puzzle is instant.
+The solution may be left out, as below. Lines starting with # are comments.
+# level clues sdm solution
+17 23 000001308006000000000983000000700200000050800059000040010006000530000024804300000
+
+Build puzzle_bank.txt with CPython:
+python sudoku_batch.py bank --count 100 --output puzzle_bank.txt
+"""
+
+
+class PuzzleBank:
+    def __init__(self, text=""):
+        # {level: {num_clues: [sdm, ...]}}
+        self.puzzles = {}
+        # {level: [sdm, ...]} for sampling a level in O(1).
+        self._level_puzzles = {}
+        # {sdm: solution sdm}
+        self.solutions = {}
+        self.add_text(text)
+
+    @staticmethod
+    def format_line(level, sdm, num_clues=None, solution=None):
+        if num_clues is None:
+            num_clues = 81 - sdm.count("0")
+        if solution is None:
+            return f"{level} {num_clues} {sdm}"
+        return f"{level} {num_clues} {sdm} {solution}"
+
+    def add(self, level, sdm, num_clues=None, solution=None):
+        if num_clues is None:
+            num_clues = 81 - sdm.count("0")
+        self.puzzles.setdefault(level, {}).setdefault(num_clues, []).append(sdm)
+        self._level_puzzles.setdefault(level, []).append(sdm)
+        if solution is not None:
+            self.solutions[sdm] = solution
+
+    def add_text(self, text):
+        for line in text.splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            level, num_clues, sdm, *solution = line.split()
+            self.add(int(level), sdm, int(num_clues), *solution)
+
+    def get_text(self):
+        lines = ["# level clues sdm solution"]
+        for level in sorted(self.puzzles):
+            for num_clues in sorted(self.puzzles[level]):
+                for sdm in self.puzzles[level][num_clues]:
+                    lines.append(
+                        self.format_line(level, sdm, num_clues, self.solutions.get(sdm))
+                    )
+        return "\n".join(lines) + "\n"
+
+    def get_levels(self):
+        return sorted(self.puzzles)
+
+    def get_num_puzzles(self, level=None):
+        if level is None:
+            return sum(len(sdms) for sdms in self._level_puzzles.values())
+        return len(self._level_puzzles.get(level, ()))
+
+    def sample(self, level, rng, num_clues=None):
+        """Return a random sdm of the level (and number of clues), or None.
+
+        rng is a random.Random or anything with its randrange().
+        """
+        if num_clues is None:
+            sdms = self._level_puzzles.get(level)
+        else:
+            sdms = self.puzzles.get(level, {}).get(num_clues)
+        if not sdms:
+            return None
+        return sdms[rng.randrange(len(sdms))]
+
+    def get_solution(self, sdm):
+        """Return the solution sdm of a bank puzzle, or None if it has none."""
+        return self.solutions.get(sdm)
@@ -0,0 +1,421 @@
+"""Sudoku Batch Jobs.
+
+Offline jobs run with CPython, not in the browser.
+
+Generate 1000 expert puzzles with all cores into bank.sdm, one sdm per line:
+python sudoku_batch.py generate --level expert --count 1000 --output bank.sdm
+
+Generate puzzles steered to need hidden singles, and nothing harder:
+python sudoku_batch.py generate --level expert --rating "hidden single"
+
+Build the puzzle bank of the web page with 100 puzzles per level:
+python sudoku_batch.py bank --count 100 --output puzzle_bank.txt
+
+Solve a file of puzzles, one sdm per line, writing 1 line per input line:
+python sudoku_batch.py solve puzzles.sdm --output solutions.sdm
+Modes: solve (solution sdm, or "-" if none), count (number of solutions,
+up to --limit) and unique ("none", "unique" or "multiple").
+
+Drop the puzzles that are symmetry variants of earlier ones,
+keeping the canonical sdms seen in an index file, reusable by later runs:
+python sudoku_batch.py dedup bank.sdm --index bank.sqlite --output unique.sdm
+"""
+
+import os
+import sys
+import time
+import sqlite3
+import argparse
+import tempfile
+from itertools import islice
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from sudoku_solver import BitmaskSudokuBoard, SudokuSolver, SolutionCache
+from sudoku_dlx import DancingLinksSolver
+from sudoku_generator import SudokuGenerator
+from sudoku_bank import PuzzleBank
+from sudoku_rating import SudokuRater
+from sudoku_symmetry import get_canonical_sdm
+
+LEVELS = {
+    "beginner": SudokuGenerator.BEGINNER,
+    "easy": SudokuGenerator.EASY,
+    "medium": SudokuGenerator.MEDIUM,
+    "hard": SudokuGenerator.HARD,
+    "expert": SudokuGenerator.EXPERT,
+}
+
+ENGINES = {
+    "search": SudokuSolver,
+    "dlx": DancingLinksSolver,
+}
+SOLVE_MODES = ("solve", "count", "unique")
+
+
+def parse_level(level):
+    """Return the level of a name like "expert" or a number of clues like "17"."""
+    if level.lower() in LEVELS:
+        return LEVELS[level.lower()]
+    return int(level)
+
+
+def ordered_map(executor, func, args_list, window):
+    """Like executor.map(), but with at most window tasks in flight,
+    so that arbitrarily long inputs and outputs use bounded memory.
+    """
+    futures = deque()
+    for args in args_list:
+        futures.append(executor.submit(func, *args))
+        if len(futures) >= window:
+            yield futures.popleft().result()
+    while futures:
+        yield futures.popleft().result()
+
+
+def parse_rating(rating):
+    """Return the SudokuRater rating of a name like "x-wing" or a number like "8"."""
+    for value, name in SudokuRater.NAMES.items():
+        if rating.lower() == name:
+            return value
+    return int(rating)
+
+
+def generate_puzzles(
+    level, seed, start, stop, target_rating=None, with_solutions=False
+):
+    """Generate the puzzles numbered from start to stop - 1 as sdm strings,
+    or as (sdm, solution sdm) pairs if with_solutions is true.
+
+    Puzzle i is generated with its own seed derived from (seed, i),
+    so the output does not depend on the number of workers.
+    The solution is the solved board the generator made the puzzle from.
+    """
+    puzzles = []
+    for i in range(start, stop):
+        cache = SolutionCache() if with_solutions else None
+        sdm = (
+            SudokuGenerator(seed=f"{seed}:{i}", cache=cache)
+            .generate_level(level=level, target_rating=target_rating)
+            .get_sdm()
+        )
+        puzzles.append((sdm, cache.get(sdm)) if with_solutions else sdm)
+    return puzzles
+
+
+def iter_puzzles(
+    count,
+    level,
+    seed=0,
+    workers=None,
+    chunk_size=8,
+    target_rating=None,
+    with_solutions=False,
+):
+    """Generate count puzzles of the level in a process pool.
+
+    Yield their sdm strings, or (sdm, solution sdm) pairs, in order.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = (
+        (
+            level,
+            seed,
+            start,
+            min(start + chunk_size, count),
+            target_rating,
+            with_solutions,
+        )
+        for start in range(0, count, chunk_size)
+    )
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for puzzles in ordered_map(executor, generate_puzzles, chunks, 4 * workers):
+            yield from puzzles
+
+
+def generate_bank(
+    output,
+    count,
+    level=SudokuGenerator.BEGINNER,
+    seed=0,
+    workers=None,
+    chunk_size=8,
+    target_rating=None,
+):
+    """Generate count puzzles of the level in a process pool,
+    writing them to the output file object in order, one sdm per line.
+
+    Return the number of puzzles per second.
+    """
+    start_time = time.perf_counter()
+    for sdm in iter_puzzles(count, level, seed, workers, chunk_size, target_rating):
+        output.write(sdm + "\n")
+    elapsed = time.perf_counter() - start_time
+    return count / elapsed if elapsed > 0 else float("inf")
+
+
+def build_puzzle_bank(output, count, levels=None, seed=0, workers=None, chunk_size=8):
+    """Generate count puzzles for each level in a process pool,
+    writing them with their solutions to the output file object
+    in the PuzzleBank text format.
+
+    Return the number of puzzles per second.
+    """
+    if levels is None:
+        levels = list(LEVELS.values())
+    start_time = time.perf_counter()
+    output.write("# level clues sdm solution\n")
+    for level in levels:
+        for sdm, solution in iter_puzzles(
+            count, level, f"{seed}:{level}", workers, chunk_size, with_solutions=True
+        ):
+            output.write(PuzzleBank.format_line(level, sdm, solution=solution) + "\n")
+    elapsed = time.perf_counter() - start_time
+    return count * len(levels) / elapsed if elapsed > 0 else float("inf")
+
+
+def read_chunks(input, chunk_size):
+    """Yield the lines of the input file object in lists of chunk_size lines."""
+    while True:
+        lines = list(islice(input, chunk_size))
+        if not lines:
+            return
+        yield lines
+
+
+def solve_puzzles(lines, mode="solve", limit=2, engine="search"):
+    """Return 1 result line per sdm line, as per the mode."""
+    solver = ENGINES[engine]()
+    results = []
+    for line in lines:
+        sdm = "".join(line.split())
+        if len(sdm) != 81 or not sdm.isdigit():
+            results.append("error")
+            continue
+        board = BitmaskSudokuBoard(sdm)
+        if mode == "solve":
+            solution = solver.get_1_solution(board)
+            results.append("-" if solution is None else solution.get_sdm())
+        elif mode == "count":
+            results.append(str(solver.count_solutions(board, limit)))
+        else:
+            solution_count = solver.count_solutions(board, 2)
+            results.append(("none", "unique", "multiple")[solution_count])
+    return results
+
+
+def solve_file(
+    input,
+    output,
+    mode="solve",
+    limit=2,
+    engine="search",
+    workers=None,
+    chunk_size=256,
+):
+    """Solve the sdm lines of the input file object in a process pool,
+    writing 1 result line per input line to the output file object, in order.
+
+    Only a bounded number of chunks is in memory at any time,
+    whatever the size of the input.
+    Return (number of puzzles, puzzles per second).
+    """
+    workers = workers or os.cpu_count() or 1
+    start_time = time.perf_counter()
+    count = 0
+    chunks = ((lines, mode, limit, engine) for lines in read_chunks(input, chunk_size))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for results in ordered_map(executor, solve_puzzles, chunks, 4 * workers):
+            output.write("\n".join(results) + "\n")
+            count += len(results)
+    elapsed = time.perf_counter() - start_time
+    return count, count / elapsed if elapsed > 0 else float("inf")
+
+
+class DedupIndex:
+    """Set of canonical sdms in an sqlite3 database file.
+
+    Its memory use does not grow with the number of puzzles,
+    and it can be reused to dedup later batches against earlier ones.
+    """
+
+    def __init__(self, path):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS puzzles (canonical TEXT PRIMARY KEY)"
+            " WITHOUT ROWID"
+        )
+
+    def add(self, canonical):
+        """Add the canonical sdm. Return whether it was not in the index yet."""
+        cursor = self.connection.execute(
+            "INSERT OR IGNORE INTO puzzles VALUES (?)", (canonical,)
+        )
+        return cursor.rowcount == 1
+
+    def commit(self):
+        self.connection.commit()
+
+    def close(self):
+        self.connection.commit()
+        self.connection.close()
+
+
+def canonicalize_puzzles(lines):
+    """Return (sdm, canonical sdm) per sdm line, skipping the other lines."""
+    results = []
+    for line in lines:
+        sdm = "".join(line.split())
+        if len(sdm) == 81 and sdm.isdigit():
+            results.append((sdm, get_canonical_sdm(sdm)))
+    return results
+
+
+def dedup_file(input, output, index, workers=None, chunk_size=256):
+    """Write the sdm lines of the input file object to the output file object,
+    in order, except those equivalent to an earlier one or to one in the index.
+
+    Canonical sdms are computed in a process pool and looked up in the index,
+    a DedupIndex, so memory use is bounded whatever the size of the input.
+    Return (number of puzzles, number written, puzzles per second).
+    """
+    workers = workers or os.cpu_count() or 1
+    start_time = time.perf_counter()
+    count = 0
+    unique_count = 0
+    chunks = ((lines,) for lines in read_chunks(input, chunk_size))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for results in ordered_map(executor, canonicalize_puzzles, chunks, 4 * workers):
+            for sdm, canonical in results:
+                if index.add(canonical):
+                    output.write(sdm + "\n")
+                    unique_count += 1
+            count += len(results)
+            index.commit()
+    elapsed = time.perf_counter() - start_time
+    return count, unique_count, count / elapsed if elapsed > 0 else float("inf")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sudoku batch jobs.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = subparsers.add_parser("generate", help="Generate puzzles.")
+    generate_parser.add_argument(
+        "--level",
+        default="beginner",
+        help=f"One of {', '.join(LEVELS)}, or a minimum number of clues.",
+    )
+    generate_parser.add_argument(
+        "--rating",
+        default=None,
+        help="Technique to steer to, and not beyond, e.g. hidden single, x-wing.",
+    )
+    generate_parser.add_argument("--count", type=int, default=100)
+    generate_parser.add_argument("--seed", default="0")
+    generate_parser.add_argument("--workers", type=int, default=None)
+    generate_parser.add_argument("--chunk-size", type=int, default=8)
+    generate_parser.add_argument("--output", default="-", help="Default: stdout.")
+
+    bank_parser = subparsers.add_parser(
+        "bank", help="Build a puzzle bank for the web page."
+    )
+    bank_parser.add_argument(
+        "--levels",
+        default=",".join(LEVELS),
+        help="Comma separated levels. Default: all of them.",
+    )
+    bank_parser.add_argument("--count", type=int, default=100, help="Per level.")
+    bank_parser.add_argument("--seed", default="0")
+    bank_parser.add_argument("--workers", type=int, default=None)
+    bank_parser.add_argument("--chunk-size", type=int, default=8)
+    bank_parser.add_argument("--output", default="-", help="Default: stdout.")
+
+    solve_parser = subparsers.add_parser("solve", help="Solve a file of puzzles.")
+    solve_parser.add_argument("input", help="One sdm per line. - for stdin.")
+    solve_parser.add_argument("--mode", choices=SOLVE_MODES, default="solve")
+    solve_parser.add_argument(
+        "--limit", type=int, default=2, help="Most solutions to count."
+    )
+    solve_parser.add_argument("--engine", choices=list(ENGINES), default="search")
+    solve_parser.add_argument("--workers", type=int, default=None)
+    solve_parser.add_argument("--chunk-size", type=int, default=256)
+    solve_parser.add_argument("--output", default="-", help="Default: stdout.")
+
+    dedup_parser = subparsers.add_parser(
+        "dedup", help="Drop the puzzles equivalent to earlier ones."
+    )
+    dedup_parser.add_argument("input", help="One sdm per line. - for stdin.")
+    dedup_parser.add_argument(
+        "--index", default=None, help="Index file to use. Default: a temporary one."
+    )
+    dedup_parser.add_argument("--workers", type=int, default=None)
+    dedup_parser.add_argument("--chunk-size", type=int, default=256)
+    dedup_parser.add_argument("--output", default="-", help="Default: stdout.")
+
+    args = parser.parse_args(argv)
+
+    output = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        if args.command == "generate":
+            count = args.count
+            rate = generate_bank(
+                output,
+                count,
+                level=parse_level(args.level),
+                seed=args.seed,
+                workers=args.workers,
+                chunk_size=args.chunk_size,
+                target_rating=args.rating and parse_rating(args.rating),
+            )
+        elif args.command == "bank":
+            levels = [parse_level(level) for level in args.levels.split(",")]
+            count = args.count * len(levels)
+            rate = build_puzzle_bank(
+                output,
+                args.count,
+                levels=levels,
+                seed=args.seed,
+                workers=args.workers,
+                chunk_size=args.chunk_size,
+            )
+        elif args.command == "solve":
+            input = sys.stdin if args.input == "-" else open(args.input)
+            try:
+                count, rate = solve_file(
+                    input,
+                    output,
+                    mode=args.mode,
+                    limit=args.limit,
+                    engine=args.engine,
+                    workers=args.workers,
+                    chunk_size=args.chunk_size,
+                )
+            finally:
+                if input is not sys.stdin:
+                    input.close()
+        elif args.command == "dedup":
+            input = sys.stdin if args.input == "-" else open(args.input)
+            with tempfile.TemporaryDirectory() as temp_dir:
+                index = DedupIndex(args.index or os.path.join(temp_dir, "dedup.sqlite"))
+                try:
+                    count, unique_count, rate = dedup_file(
+                        input,
+                        output,
+                        index,
+                        workers=args.workers,
+                        chunk_size=args.chunk_size,
+                    )
+                finally:
+                    index.close()
+                    if input is not sys.stdin:
+                        input.close()
+            print(f"{unique_count} unique puzzles.", file=sys.stderr)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print(f"{count} puzzles, {rate:.2f} puzzles/s.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""Sudoku Benchmark.
+
+Times the solver and the generator with CPython over a fixed puzzle corpus.
+
+Run the benchmark and save the results:
+python sudoku_benchmark.py run --output results.json
+
+Compare 2 runs:
+python sudoku_benchmark.py compare before.json after.json
+
+Rebuild the corpus (bump CORPUS_VERSION when its puzzles change):
+python sudoku_benchmark.py make-corpus
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import asyncio
+import argparse
+import platform
+import statistics
+import tracemalloc
+
+import sudoku_solver
+from sudoku_solver import BitmaskSudokuBoard, SudokuSolver, SearchStats
+from sudoku_generator import SudokuGenerator
+
+CORPUS_VERSION = 1
+CORPUS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "benchmark_corpus.txt"
+)
+CORPUS_LEVELS = [
+    SudokuGenerator.BEGINNER,
+    SudokuGenerator.EASY,
+    SudokuGenerator.MEDIUM,
+    SudokuGenerator.HARD,
+    SudokuGenerator.EXPERT,
+]
+CORPUS_PUZZLES_PER_LEVEL = 10
+
+
+def make_corpus():
+    """Return the corpus text: the samples in the sudoku_solver docstring,
+    the hardest one, and generated puzzles for each level.
+    """
+    lines = [f"# version {CORPUS_VERSION}", "# set sdm"]
+    doc_lines = [line.strip() for line in sudoku_solver.__doc__.splitlines()]
+    for i, line in enumerate(doc_lines):
+        if len(line) == 81 and line.isdigit():
+            name = "hardest" if doc_lines[i - 1] == "Hardest:" else "samples"
+            lines.append(f"{name} {line}")
+    for level in CORPUS_LEVELS:
+        for i in range(CORPUS_PUZZLES_PER_LEVEL):
+            generator = SudokuGenerator(seed=f"corpus-{CORPUS_VERSION}:{level}:{i}")
+            lines.append(f"level-{level} {generator.generate_level(level).get_sdm()}")
+    return "\n".join(lines) + "\n"
+
+
+def load_corpus(path=CORPUS_PATH):
+    """Return ({set name: [sdm, ...]}, version) of the corpus file."""
+    corpus = {}
+    version = None
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("# version"):
+                version = int(line.split()[-1])
+            if not line or line.startswith("#"):
+                continue
+            name, sdm = line.split()
+            corpus.setdefault(name, []).append(sdm)
+    return corpus, version
+
+
+# name: function(solver, board, stats)
+SOLVER_OPS = {
+    "get_1_solution": lambda solver, board, stats: solver.get_1_solution(
+        board, stats=stats
+    ),
+    "get_all_solutions": lambda solver, board, stats: solver.get_all_solutions(
+        board, stats=stats
+    ),
+    "at_most_1_solution": lambda solver, board, stats: solver.at_most_1_solution(
+        board, stats=stats
+    ),
+    "async_get_1_solution": lambda solver, board, stats: asyncio.run(
+        solver.async_get_1_solution(board, stats=stats)
+    ),
+    "async_get_all_solutions": lambda solver, board, stats: asyncio.run(
+        solver.async_get_all_solutions(board, stats=stats)
+    ),
+    "async_at_most_1_solution": lambda solver, board, stats: asyncio.run(
+        solver.async_at_most_1_solution(board, stats=stats)
+    ),
+}
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[max(0, math.ceil(p / 100 * len(values)) - 1)]
+
+
+def summarize(name, op, latencies, nodes=None, peak_bytes=None):
+    total = sum(latencies)
+    return {
+        "set": name,
+        "op": op,
+        "count": len(latencies),
+        "median_ms": statistics.median(latencies) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "total_s": total,
+        "nodes": nodes,
+        "nodes_per_s": None if nodes is None or total == 0 else nodes / total,
+        "peak_kib": None if peak_bytes is None else peak_bytes / 1024,
+    }
+
+
+def measure_peak(func):
+    """Return the peak memory allocated while running func()."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_solver(corpus, repeat=1):
+    results = []
+    solver = SudokuSolver()
+    for name, sdms in corpus.items():
+        boards = [BitmaskSudokuBoard(sdm) for sdm in sdms]
+        for op, func in SOLVER_OPS.items():
+            latencies = []
+            for _ in range(repeat):
+                for board in boards:
+                    start_time = time.perf_counter()
+                    func(solver, board, None)
+                    latencies.append(time.perf_counter() - start_time)
+            # Nodes are counted in an untimed pass, as counting them slows the search.
+            stats = SearchStats()
+            for board in boards:
+                func(solver, board, stats)
+            peak_bytes = max(
+                measure_peak(lambda: func(solver, board, None)) for board in boards
+            )
+            results.append(
+                summarize(name, op, latencies, stats.nodes * repeat, peak_bytes)
+            )
+    return results
+
+
+def bench_generator(num_puzzles=5):
+    results = []
+    for level in CORPUS_LEVELS:
+        latencies = []
+        for i in range(num_puzzles):
+            generator = SudokuGenerator(seed=f"bench:{level}:{i}")
+            start_time = time.perf_counter()
+            generator.generate_level(level)
+            latencies.append(time.perf_counter() - start_time)
+        peak_bytes = measure_peak(
+            lambda: SudokuGenerator(seed=f"bench:{level}").generate_level(level)
+        )
+        result = summarize(
+            f"level-{level}", "generate_level", latencies, None, peak_bytes
+        )
+        result["puzzles_per_s"] = len(latencies) / sum(latencies)
+        results.append(result)
+    return results
+
+
+def run(repeat=1, num_puzzles=5, corpus_path=CORPUS_PATH):
+    corpus, version = load_corpus(corpus_path)
+    return {
+        "corpus_version": version,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": bench_solver(corpus, repeat) + bench_generator(num_puzzles),
+    }
+
+
+def format_results(report):
+    lines = [
+        f"corpus v{report['corpus_version']}, "
+        f"{report['implementation']} {report['python']} {report['machine']}",
+        f"{'set':<12} {'op':<26} {'n':>4} {'median ms':>10} {'p95 ms':>10} "
+        f"{'nodes/s':>10} {'peak KiB':>9}",
+    ]
+    for result in report["results"]:
+        nodes_per_s = result["nodes_per_s"]
+        lines.append(
+            f"{result['set']:<12} {result['op']:<26} {result['count']:>4} "
+            f"{result['median_ms']:>10.2f} {result['p95_ms']:>10.2f} "
+            f"{'-' if nodes_per_s is None else f'{nodes_per_s:.0f}':>10} "
+            f"{result['peak_kib']:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def compare(before, after):
+    """Return lines comparing the median latencies of 2 reports."""
+    if before["corpus_version"] != after["corpus_version"]:
+        yield "Warning: the corpus versions differ."
+    before_results = {(r["set"], r["op"]): r for r in before["results"]}
+    for result in after["results"]:
+        key = (result["set"], result["op"])
+        if key not in before_results:
+            continue
+        old_ms = before_results[key]["median_ms"]
+        new_ms = result["median_ms"]
+        ratio = old_ms / new_ms if new_ms else float("inf")
+        yield (
+            f"{key[0]:<12} {key[1]:<26} {old_ms:>10.2f} -> {new_ms:>10.2f} ms "
+            f"({ratio:.2f}x)"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sudoku benchmark.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmark.")
+    run_parser.add_argument("--repeat", type=int, default=1)
+    run_parser.add_argument(
+        "--puzzles", type=int, default=5, help="Generated puzzles per level."
+    )
+    run_parser.add_argument("--corpus", default=CORPUS_PATH)
+    run_parser.add_argument("--output", help="Save the results as json.")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare 2 results.")
+    compare_parser.add_argument("before")
+    compare_parser.add_argument("after")
+
+    subparsers.add_parser("make-corpus", help="Rebuild the corpus file.")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        report = run(args.repeat, args.puzzles, args.corpus)
+        print(format_results(report))
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(report, f, indent=2)
+    elif args.command == "compare":
+        with open(args.before) as f:
+            before = json.load(f)
+        with open(args.after) as f:
+            after = json.load(f)
+        for line in compare(before, after):
+            print(line)
+    elif args.command == "make-corpus":
+        with open(CORPUS_PATH, "w") as f:
+            f.write(make_corpus())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+"""Sudoku Dancing Links Solver.
+
+Sudoku as an exact cover problem, solved with Knuth's Algorithm X
+on Dancing Links.
+
+Each of the 729 rows is a candidate (r, c, val),
+and each of the 324 columns is a constraint that must be covered exactly once:
+0   - 80:  point (r, c) is filled.
+81  - 161: row r has val.
+162 - 242: column c has val.
+243 - 323: block b has val.
+"""
+
+import time
+
+from sudoku_solver import SudokuBoard, YieldPolicy
+
+
+class DancingLinks:
+    NUM_COLUMNS = 324
+
+    def __init__(self, board, stats=None):
+        """Build the links for the board and select the rows of its clues.
+
+        If the clues clash with each other, self.conflict is True.
+        If stats is a sudoku_solver.SearchStats, the search is counted into it.
+        """
+        self.stats = stats
+        n = self.NUM_COLUMNS + 1  # Node 0 is the root.
+        self.L = [i - 1 for i in range(n)]
+        self.L[0] = n - 1
+        self.R = [i + 1 for i in range(n)]
+        self.R[n - 1] = 0
+        self.U = list(range(n))
+        self.D = list(range(n))
+        self.C = list(range(n))
+        self.S = [0] * n
+        self.points = [None] * n  # The (r, c, val) of the row of each node.
+
+        for r in range(9):
+            for c in range(9):
+                b = SudokuBoard.get_block_num_from_position(r, c)
+                for val in range(1, 10):
+                    self._add_row(
+                        (r, c, val),
+                        (
+                            1 + r * 9 + c,
+                            1 + 81 + r * 9 + val - 1,
+                            1 + 162 + c * 9 + val - 1,
+                            1 + 243 + b * 9 + val - 1,
+                        ),
+                    )
+
+        self.conflict = False
+        covered = set()
+        for r in range(9):
+            for c in range(9):
+                val = board.get_cell(r, c)
+                if val == SudokuBoard.EMPTY:
+                    continue
+                first = self.get_first_node(r, c, val)
+                for node in range(first, first + 4):
+                    col = self.C[node]
+                    if col in covered:
+                        self.conflict = True
+                        return
+                    covered.add(col)
+                    self.cover(col)
+
+    def _add_row(self, point, cols):
+        first = len(self.L)
+        for k, col in enumerate(cols):
+            node = first + k
+            self.L.append(first + (k - 1) % 4)
+            self.R.append(first + (k + 1) % 4)
+            self.U.append(self.U[col])
+            self.D.append(col)
+            self.D[self.U[col]] = node
+            self.U[col] = node
+            self.C.append(col)
+            self.S[col] += 1
+            self.points.append(point)
+
+    def get_first_node(self, r, c, val):
+        return self.NUM_COLUMNS + 1 + ((r * 9 + c) * 9 + val - 1) * 4
+
+    def cover(self, col):
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        L[R[col]] = L[col]
+        R[L[col]] = R[col]
+        i = D[col]
+        while i != col:
+            j = R[i]
+            while j != i:
+                U[D[j]] = U[j]
+                D[U[j]] = D[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def uncover(self, col):
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        i = U[col]
+        while i != col:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                U[D[j]] = j
+                D[U[j]] = j
+                j = L[j]
+            i = U[i]
+        L[R[col]] = col
+        R[L[col]] = col
+
+    def search(self, selected=None):
+        """Recursively search for exact covers.
+
+        Yield None at every node visited, and a list of (r, c, val)
+        every time an exact cover is found.
+        """
+        if selected is None:
+            selected = []
+
+        yield None
+
+        stats = self.stats
+        if stats is not None:
+            stats.nodes += 1
+            stats.max_depth = max(stats.max_depth, len(selected))
+
+        R, D, C, S = self.R, self.D, self.C, self.S
+        if R[0] == 0:
+            yield [self.points[node] for node in selected]
+            return
+
+        if stats is not None:
+            stats.candidate_scans += 1
+
+        # Choose the column with the fewest rows.
+        target_col = R[0]
+        col = R[target_col]
+        while col != 0:
+            if S[col] < S[target_col]:
+                target_col = col
+            col = R[col]
+        if S[target_col] == 0:
+            if stats is not None:
+                stats.backtracks += 1
+            return
+
+        self.cover(target_col)
+        node = D[target_col]
+        while node != target_col:
+            selected.append(node)
+            j = R[node]
+            while j != node:
+                self.cover(C[j])
+                j = R[j]
+
+            yield from self.search(selected)
+
+            j = self.L[node]
+            while j != node:
+                self.uncover(C[j])
+                j = self.L[j]
+            selected.pop()
+            node = D[node]
+        self.uncover(target_col)
+
+
+class DancingLinksSolver:
+    """Drop-in alternative to SudokuSolver using Dancing Links."""
+
+    def __init__(self, yield_policy=None, cache=None):
+        self.yield_policy = yield_policy or YieldPolicy()
+        self.cache = cache
+
+    def _search(self, board, stats=None):
+        if stats is None:
+            links = DancingLinks(board)
+        else:
+            start_time = time.perf_counter()
+            links = DancingLinks(board, stats)
+            stats.add_time("build", time.perf_counter() - start_time)
+        if links.conflict:
+            return iter(())
+        return links.search()
+
+    def _make_solution(self, board, points, stats=None):
+        solution = board.copy()
+        if stats is not None:
+            stats.board_copies += 1
+        for r, c, val in points:
+            solution.set_cell(r, c, val)
+        return solution
+
+    def _iter_points(self, board, limit=None, stats=None):
+        solution_count = 0
+        if limit is not None and limit <= 0:
+            return
+        start_time = time.perf_counter()
+        for points in self._search(board, stats):
+            if points is not None:
+                if stats is not None:
+                    stats.add_time("search", time.perf_counter() - start_time)
+                yield points
+                start_time = time.perf_counter()
+                solution_count += 1
+                if limit is not None and solution_count >= limit:
+                    return
+        if stats is not None:
+            stats.add_time("search", time.perf_counter() - start_time)
+
+    def get_1_solution(self, board, show_step=False, stats=None):
+        """show_step is accepted, and ignored, as in SudokuSolver.get_1_solution()."""
+        if self.cache is not None:
+            solution = self.cache.get_solution(board)
+            if solution is not None:
+                return solution
+        for points in self._iter_points(board, 1, stats):
+            solution = self._make_solution(board, points, stats)
+            if self.cache is not None:
+                self.cache.put_solution(board, solution)
+            return solution
+        return None
+
+    def iter_solutions(self, board, limit=None, stats=None):
+        """Yield the solutions one by one as new boards, at most limit of them."""
+        for points in self._iter_points(board, limit, stats):
+            yield self._make_solution(board, points, stats)
+
+    def count_solutions(self, board, limit=None, stats=None):
+        """Count the solutions, stopping at limit, without keeping any of them."""
+        return sum(1 for points in self._iter_points(board, limit, stats))
+
+    def get_all_solutions(self, board, limit=None, stats=None):
+        return list(self.iter_solutions(board, limit, stats))
+
+    def at_most_1_solution(self, board, stats=None):
+        # return (True, 0) or (True, 1) or (False, None)
+        solution_count = self.count_solutions(board, limit=2, stats=stats)
+        if solution_count > 1:
+            return (False, None)
+        return (True, solution_count)
+
+    async def _async_next(self, search):
+        """Return the next solution of the search, or None if there is none,
+        yielding to the event loop as per self.yield_policy.
+        """
+        policy = self.yield_policy
+        nodes = 0
+        for points in search:
+            if points is not None:
+                await policy.tick(nodes)
+                return points
+            nodes += 1
+            if policy.step_nodes is not None and nodes >= policy.step_nodes:
+                await policy.tick(nodes)
+                nodes = 0
+        await policy.tick(nodes)
+        return None
+
+    async def _async_iter_points(self, board, limit=None, stats=None):
+        search = self._search(board, stats)
+        solution_count = 0
+        while limit is None or solution_count < limit:
+            points = await self._async_next(search)
+            if points is None:
+                return
+            solution_count += 1
+            yield points
+
+    async def async_get_1_solution(self, board, stats=None):
+        if self.cache is not None:
+            solution = self.cache.get_solution(board)
+            if solution is not None:
+                return solution
+        async for points in self._async_iter_points(board, 1, stats):
+            solution = self._make_solution(board, points, stats)
+            if self.cache is not None:
+                self.cache.put_solution(board, solution)
+            return solution
+        return None
+
+    async def async_iter_solutions(self, board, limit=None, stats=None):
+        async for points in self._async_iter_points(board, limit, stats):
+            yield self._make_solution(board, points, stats)
+
+    async def async_count_solutions(self, board, limit=None, stats=None):
+        solution_count = 0
+        async for points in self._async_iter_points(board, limit, stats):
+            solution_count += 1
+        return solution_count
+
+    async def async_get_all_solutions(self, board, limit=None, stats=None):
+        return [
+            solution
+            async for solution in self.async_iter_solutions(board, limit, stats)
+        ]
+
+    async def async_at_most_1_solution(self, board, stats=None):
+        # return (True, 0) or (True, 1) or (False, None)
+        solution_count = await self.async_count_solutions(board, limit=2, stats=stats)
+        if solution_count > 1:
+            return (False, None)
+        return (True, solution_count)
+
+
+def test_sudoku_dlx():
+    sdm = "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+
+    board = SudokuBoard(sdm)
+    solver = DancingLinksSolver()
+
+    print("Before solving:")
+    print(board)
+
+    solution = solver.get_1_solution(board)
+
+    print("After solving:")
+    print(repr(solution))
+    print()
+    print(solution)
+
+    print("At most 1 solution:")
+    print(solver.at_most_1_solution(board))
+
+
+if __name__ == "__main__":
+    test_sudoku_dlx()
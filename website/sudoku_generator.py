@@ -3,11 +3,11 @@
 A challenging number of clues is within the range from 17 to 32.
 """
 
-import time
 import random
-import asyncio
 
-from sudoku_solver import SudokuBoard, SudokuSolver
+from sudoku_solver import SudokuBoard, BitmaskSudokuBoard, SudokuSolver, YieldPolicy
+from sudoku_rating import SudokuRater
+from sudoku_symmetry import SudokuTransform
 
 
 class SudokuGenerator:
@@ -17,9 +17,21 @@ class SudokuGenerator:
     HARD = 28
     EXPERT = 17
 
-    def __init__(self, seed=None) -> None:
-        if seed is not None:
-            random.seed(seed)
+    def __init__(
+        self, seed=None, solver_class=None, yield_policy=None, cache=None
+    ) -> None:
+        """solver_class may be any class with the SudokuSolver API,
+        e.g. sudoku_dlx.DancingLinksSolver. It defaults to SudokuSolver.
+        yield_policy is shared by the solvers of the async methods.
+        Each generator draws from its own random.Random(seed),
+        so generators do not interfere with each other or the random module.
+        If cache (a SolutionCache) is given, each puzzle is put in it
+        with the solved board it was made from.
+        """
+        self.random = random.Random(seed)
+        self.solver_class = solver_class or SudokuSolver
+        self.yield_policy = yield_policy or YieldPolicy()
+        self.cache = cache
 
     def _block_048_or_246(self):
         """Block048: 0, block246: 1
@@ -29,19 +41,19 @@ class SudokuGenerator:
         3 4 5
         6 7 8
         """
-        return random.choice([0, 1])
+        return self.random.choice([0, 1])
 
     def _set_block_randomly(self, board, b):
         vals = sorted(SudokuBoard.FULL_SET)
-        random.shuffle(vals)
+        self.random.shuffle(vals)
         block = [[vals[r * 3 + c] for c in range(3)] for r in range(3)]
         r0, c0 = board.get_position_from_block_num(b)
         for dr in range(3):
             for dc in range(3):
-                board.grid[r0 + dr][c0 + dc] = block[dr][dc]
+                board.set_cell(r0 + dr, c0 + dc, block[dr][dc])
 
     def generate_solved_board(self):
-        board = SudokuBoard("0" * 81)
+        board = BitmaskSudokuBoard("0" * 81)
         if self._block_048_or_246():
             self._set_block_randomly(board, 2)
             self._set_block_randomly(board, 4)
@@ -50,34 +62,135 @@ class SudokuGenerator:
             self._set_block_randomly(board, 0)
             self._set_block_randomly(board, 4)
             self._set_block_randomly(board, 8)
-        return SudokuSolver().get_1_solution(board)
+        return self.solver_class().get_1_solution(board)
+
+    def _has_other_solution(self, solver, board, r, c, val):
+        """Check if the board has a solution without val at (r, c).
 
-    def generate(self, min_clues=17):
+        The board had a unique solution before (r, c) was emptied,
+        so any other solution must differ from it at (r, c).
+        Only those alternatives are searched for,
+        and none at all if val is the only possible value at (r, c).
+        """
+        possible_set = board.get_possible_set(r, c)
+        if possible_set is None or len(possible_set) <= 1:
+            return False
+
+        for other_val in possible_set:
+            if other_val == val:
+                continue
+            board.set_cell(r, c, other_val)
+            solution = solver.get_1_solution(board)
+            board.set_cell(r, c, SudokuBoard.EMPTY)
+            if solution is not None:
+                return True
+        return False
+
+    def _pick_removal(self, rater, board, removals, target_rating):
+        """Pop from removals the (r, c, val) whose removal makes the board
+        rate the hardest without exceeding target_rating, and return it
+        with that rating, or return (None, None) if every removal exceeds it.
+
+        Removals that exceed it are dropped, as removing more clues
+        rarely makes a puzzle easier. The board is left as it is.
+        A board rated below SudokuRater.UNRATED is solved by logic alone,
+        so it has a unique solution.
+        """
+        best_removal = None
+        best_rating = None
+        for removal in removals[:]:
+            r, c, val = removal
+            board.set_cell(r, c, SudokuBoard.EMPTY)
+            rating = rater.rate(board)
+            board.set_cell(r, c, val)
+            if rating > target_rating:
+                removals.remove(removal)
+            elif best_rating is None or rating > best_rating:
+                best_removal = removal
+                best_rating = rating
+        if best_removal is not None:
+            removals.remove(best_removal)
+        return best_removal, best_rating
+
+    def generate(self, min_clues=17, progress=None, target_rating=None):
+        """Generate a puzzle with a unique solution and at least min_clues clues.
+
+        progress(num_clues) is called, if given, after each clue removal attempt.
+        If target_rating (a SudokuRater rating) is given, generation is steered
+        to it: each step removes the clue that makes the puzzle rate the hardest
+        without exceeding it, so the rating climbs to the target and stays there.
+        If the solved board allows no puzzle that hard, the puzzle rates
+        the hardest reached.
+        """
         board = self.generate_solved_board()
-        solver = SudokuSolver()
+        solver = self.solver_class()
+        rater = SudokuRater()
 
+        solution = board.copy()
         full_list = [(r, c, board.grid[r][c]) for r in range(9) for c in range(9)]
-        random.shuffle(full_list)
+        self.random.shuffle(full_list)
         num_clues = 81
 
         while full_list and num_clues > min_clues:
-            r, c, val = full_list.pop()
-            board.grid[r][c] = 0
+            if target_rating is None:
+                r, c, val = full_list.pop()
+                rating = None
+            else:
+                removal, rating = self._pick_removal(
+                    rater, board, full_list, target_rating
+                )
+                if removal is None:
+                    break
+                r, c, val = removal
+            board.set_cell(r, c, SudokuBoard.EMPTY)
             num_clues -= 1
-            single_solution, temp = solver.at_most_1_solution(board)
-            if not single_solution:
-                board.grid[r][c] = val
+            solved_by_logic = rating is not None and rating < SudokuRater.UNRATED
+            if not solved_by_logic and self._has_other_solution(
+                solver, board, r, c, val
+            ):
+                board.set_cell(r, c, val)
                 num_clues += 1
+            if progress is not None:
+                progress(num_clues)
 
+        if self.cache is not None:
+            self.cache.put_solution(board, solution)
         return board
 
-    def generate_level(self, level=None):
+    def generate_level(self, level=None, progress=None, target_rating=None):
         if level is None:
             level = self.BEGINNER
-        return self.generate(random.randrange(level, level + 4))
+        return self.generate(
+            self.random.randrange(level, level + 4), progress, target_rating
+        )
+
+    def generate_variant(self, seeds, solution=None):
+        """Generate a puzzle by applying a random SudokuTransform to a seed puzzle.
+
+        seeds is an sdm, or a list of them to pick the seed from, e.g. puzzles
+        of a PuzzleBank level or generated before. The puzzle has the same
+        number of clues, rating and number of solutions as its seed,
+        and takes microseconds instead of a search per clue removal.
+        The solution of the seed, if given or in the cache,
+        is transformed alike and put in the cache.
+        A solution can only be given with a single seed sdm.
+        """
+        if isinstance(seeds, str):
+            sdm = seeds
+        elif solution is not None:
+            raise ValueError("solution is only accepted with a single seed sdm")
+        else:
+            sdm = self.random.choice(seeds)
+        transform = SudokuTransform.random(self.random)
+        board = BitmaskSudokuBoard(transform.apply(sdm))
+        if self.cache is not None:
+            solution = solution or self.cache.get(sdm)
+            if solution is not None:
+                self.cache.put(board.get_sdm(), transform.apply(solution))
+        return board
 
     async def async_generate_solved_board(self):
-        board = SudokuBoard("0" * 81)
+        board = BitmaskSudokuBoard("0" * 81)
         if self._block_048_or_246():
             self._set_block_randomly(board, 2)
             self._set_block_randomly(board, 4)
@@ -86,31 +199,85 @@ class SudokuGenerator:
             self._set_block_randomly(board, 0)
             self._set_block_randomly(board, 4)
             self._set_block_randomly(board, 8)
-        return await SudokuSolver().async_get_1_solution(board)
-
-    async def async_generate(self, min_clues=17):
+        solver = self.solver_class(yield_policy=self.yield_policy)
+        return await solver.async_get_1_solution(board)
+
+    async def _async_has_other_solution(self, solver, board, r, c, val):
+        possible_set = board.get_possible_set(r, c)
+        if possible_set is None or len(possible_set) <= 1:
+            return False
+
+        for other_val in possible_set:
+            if other_val == val:
+                continue
+            board.set_cell(r, c, other_val)
+            solution = await solver.async_get_1_solution(board)
+            board.set_cell(r, c, SudokuBoard.EMPTY)
+            if solution is not None:
+                return True
+        return False
+
+    async def _async_pick_removal(self, rater, board, removals, target_rating):
+        best_removal = None
+        best_rating = None
+        for removal in removals[:]:
+            r, c, val = removal
+            board.set_cell(r, c, SudokuBoard.EMPTY)
+            rating = rater.rate(board)
+            board.set_cell(r, c, val)
+            if rating > target_rating:
+                removals.remove(removal)
+            elif best_rating is None or rating > best_rating:
+                best_removal = removal
+                best_rating = rating
+            await self.yield_policy.tick()
+        if best_removal is not None:
+            removals.remove(best_removal)
+        return best_removal, best_rating
+
+    async def async_generate(self, min_clues=17, progress=None, target_rating=None):
         board = await self.async_generate_solved_board()
-        solver = SudokuSolver()
+        solver = self.solver_class(yield_policy=self.yield_policy)
+        rater = SudokuRater()
 
+        solution = board.copy()
         full_list = [(r, c, board.grid[r][c]) for r in range(9) for c in range(9)]
-        random.shuffle(full_list)
+        self.random.shuffle(full_list)
         num_clues = 81
 
         while full_list and num_clues > min_clues:
-            r, c, val = full_list.pop()
-            board.grid[r][c] = 0
+            if target_rating is None:
+                r, c, val = full_list.pop()
+                rating = None
+            else:
+                removal, rating = await self._async_pick_removal(
+                    rater, board, full_list, target_rating
+                )
+                if removal is None:
+                    break
+                r, c, val = removal
+            board.set_cell(r, c, SudokuBoard.EMPTY)
             num_clues -= 1
-            single_solution, temp = await solver.async_at_most_1_solution(board)
-            if not single_solution:
-                board.grid[r][c] = val
+            solved_by_logic = rating is not None and rating < SudokuRater.UNRATED
+            if not solved_by_logic and await self._async_has_other_solution(
+                solver, board, r, c, val
+            ):
+                board.set_cell(r, c, val)
                 num_clues += 1
+            if progress is not None:
+                progress(num_clues)
+            await self.yield_policy.tick()
 
+        if self.cache is not None:
+            self.cache.put_solution(board, solution)
         return board
 
-    async def async_generate_level(self, level=None):
+    async def async_generate_level(self, level=None, progress=None, target_rating=None):
         if level is None:
             level = self.BEGINNER
-        return await self.async_generate(random.randrange(level, level + 6))
+        return await self.async_generate(
+            self.random.randrange(level, level + 6), progress, target_rating
+        )
 
 
 def test_sudoku_generator():
@@ -122,6 +289,8 @@ def test_sudoku_generator():
 
 
 async def async_test_sudoku_generator():
+    import asyncio
+
     env_dict = {}
     env_dict["end_event"] = asyncio.Event()
     env_dict["sec_count"] = 0
@@ -150,4 +319,5 @@ async def async_test_sudoku_generator():
 
 if __name__ == "__main__":
     test_sudoku_generator()
+    # import asyncio
     # asyncio.run(async_test_sudoku_generator())
@@ -0,0 +1,296 @@
+"""Sudoku Rating.
+
+Rates a puzzle by the hardest technique a human needs to solve it,
+applying the easiest technique that makes progress at each step:
+singles, locked candidates, naked and hidden pairs and triples,
+X-wing and swordfish.
+A puzzle these techniques cannot solve is rated UNRATED.
+
+It is fast enough to rate every clue removal of SudokuGenerator.generate().
+"""
+
+from itertools import combinations
+
+
+class SudokuRater:
+    NAKED_SINGLE = 1
+    HIDDEN_SINGLE = 2
+    LOCKED_CANDIDATES = 3
+    NAKED_PAIR = 4
+    HIDDEN_PAIR = 5
+    NAKED_TRIPLE = 6
+    HIDDEN_TRIPLE = 7
+    X_WING = 8
+    SWORDFISH = 9
+    UNRATED = 10
+
+    NAMES = {
+        NAKED_SINGLE: "naked single",
+        HIDDEN_SINGLE: "hidden single",
+        LOCKED_CANDIDATES: "locked candidates",
+        NAKED_PAIR: "naked pair",
+        HIDDEN_PAIR: "hidden pair",
+        NAKED_TRIPLE: "naked triple",
+        HIDDEN_TRIPLE: "hidden triple",
+        X_WING: "x-wing",
+        SWORDFISH: "swordfish",
+        UNRATED: "unrated",
+    }
+
+    FULL_MASK = 0x1FF
+    BITS = [0] + [1 << (val - 1) for val in range(1, 10)]
+    BIT_VALS = {1 << (val - 1): val for val in range(1, 10)}
+    POPCOUNTS = [bin(mask).count("1") for mask in range(0x200)]
+
+    # Units of point indices r * 9 + c: rows 0-8, columns 9-17, blocks 18-26.
+    ROWS = [[r * 9 + c for c in range(9)] for r in range(9)]
+    COLS = [[r * 9 + c for r in range(9)] for c in range(9)]
+    BLOCKS = [
+        [(b // 3 * 3 + i // 3) * 9 + b % 3 * 3 + i % 3 for i in range(9)]
+        for b in range(9)
+    ]
+    UNITS = ROWS + COLS + BLOCKS
+    PEERS = [
+        [
+            r * 9 + c
+            for r in range(9)
+            for c in range(9)
+            if (r == i // 9 or c == i % 9 or (r // 3, c // 3) == (i // 27, i % 9 // 3))
+            and r * 9 + c != i
+        ]
+        for i in range(81)
+    ]
+
+    @classmethod
+    def get_name(cls, rating):
+        return cls.NAMES[rating]
+
+    def rate(self, board):
+        """Return the rating of the board, the hardest technique it needs.
+
+        A board with clashing clues or with no solution is rated UNRATED.
+        """
+        cells = [board.get_cell(i // 9, i % 9) for i in range(81)]
+        masks = [0] * 81
+        for i in range(81):
+            if cells[i] == 0:
+                used = 0
+                for p in self.PEERS[i]:
+                    used |= self.BITS[cells[p]]
+                masks[i] = self.FULL_MASK & ~used
+            elif any(cells[p] == cells[i] for p in self.PEERS[i]):
+                return self.UNRATED
+
+        techniques = [
+            (self.NAKED_SINGLE, self._naked_single),
+            (self.HIDDEN_SINGLE, self._hidden_single),
+            (self.LOCKED_CANDIDATES, self._locked_candidates),
+            (self.NAKED_PAIR, self._naked_pair),
+            (self.HIDDEN_PAIR, self._hidden_pair),
+            (self.NAKED_TRIPLE, self._naked_triple),
+            (self.HIDDEN_TRIPLE, self._hidden_triple),
+            (self.X_WING, self._x_wing),
+            (self.SWORDFISH, self._swordfish),
+        ]
+
+        rating = self.NAKED_SINGLE
+        while 0 in cells:
+            for technique_rating, technique in techniques:
+                progress = technique(cells, masks)
+                if progress is None:
+                    return self.UNRATED  # Contradiction: no solution.
+                if progress:
+                    rating = max(rating, technique_rating)
+                    break
+            else:
+                return self.UNRATED
+        return rating
+
+    def _place(self, cells, masks, i, val):
+        cells[i] = val
+        masks[i] = 0
+        keep = ~self.BITS[val]
+        for p in self.PEERS[i]:
+            masks[p] &= keep
+
+    def _naked_single(self, cells, masks):
+        """Place every cell with a single candidate.
+
+        Return whether any was placed, or None on an empty cell without candidates.
+        """
+        progress = False
+        for i in range(81):
+            if cells[i]:
+                continue
+            mask = masks[i]
+            if not mask:
+                return None
+            if mask & (mask - 1) == 0:
+                self._place(cells, masks, i, self.BIT_VALS[mask])
+                progress = True
+        return progress
+
+    def _hidden_single(self, cells, masks):
+        for unit in self.UNITS:
+            seen_once = 0
+            seen_twice = 0
+            placed = 0
+            for i in unit:
+                seen_twice |= seen_once & masks[i]
+                seen_once |= masks[i]
+                placed |= self.BITS[cells[i]]
+            if (seen_once | placed) & self.FULL_MASK != self.FULL_MASK:
+                return None  # A value has no place left in the unit.
+            singles = seen_once & ~seen_twice
+            if singles:
+                bit = singles & -singles
+                for i in unit:
+                    if masks[i] & bit:
+                        self._place(cells, masks, i, self.BIT_VALS[bit])
+                        return True
+        return False
+
+    def _eliminate(self, masks, points, mask):
+        """Remove the candidates in mask from the points. Return whether any was."""
+        progress = False
+        for p in points:
+            if masks[p] & mask:
+                masks[p] &= ~mask
+                progress = True
+        return progress
+
+    def _locked_candidates(self, cells, masks):
+        # Pointing: the candidates of a value in a block all lie in 1 row or column.
+        # Claiming: those of a row or column all lie in 1 block.
+        for b, block in enumerate(self.BLOCKS):
+            for bit in self.BITS[1:]:
+                points = [i for i in block if masks[i] & bit]
+                if len(points) < 2:
+                    continue
+                for line in (self.ROWS[points[0] // 9], self.COLS[points[0] % 9]):
+                    if all(p in line for p in points):
+                        others = [p for p in line if p not in block]
+                        if self._eliminate(masks, others, bit):
+                            return True
+        for line in self.ROWS + self.COLS:
+            for bit in self.BITS[1:]:
+                points = [i for i in line if masks[i] & bit]
+                if len(points) < 2:
+                    continue
+                for block in self.BLOCKS:
+                    if all(p in block for p in points):
+                        others = [p for p in block if p not in line]
+                        if self._eliminate(masks, others, bit):
+                            return True
+                        break
+        return False
+
+    def _naked_subset(self, cells, masks, n):
+        """n cells of a unit with n candidates between them
+        take those candidates from the rest of the unit.
+        """
+        for unit in self.UNITS:
+            points = [
+                i for i in unit if cells[i] == 0 and self.POPCOUNTS[masks[i]] <= n
+            ]
+            for subset in combinations(points, n):
+                mask = 0
+                for i in subset:
+                    mask |= masks[i]
+                if self.POPCOUNTS[mask] == n:
+                    others = [i for i in unit if i not in subset]
+                    if self._eliminate(masks, others, mask):
+                        return True
+        return False
+
+    def _naked_pair(self, cells, masks):
+        return self._naked_subset(cells, masks, 2)
+
+    def _naked_triple(self, cells, masks):
+        return self._naked_subset(cells, masks, 3)
+
+    def _hidden_subset(self, cells, masks, n):
+        """n values of a unit with only n cells between them
+        take the other candidates from those cells.
+        """
+        for unit in self.UNITS:
+            # {val bit: bitmask of the unit positions where it is a candidate}
+            positions = {}
+            for k, i in enumerate(unit):
+                mask = masks[i]
+                while mask:
+                    bit = mask & -mask
+                    positions[bit] = positions.get(bit, 0) | 1 << k
+                    mask &= mask - 1
+            bits = [bit for bit in positions if self.POPCOUNTS[positions[bit]] <= n]
+            for subset in combinations(bits, n):
+                union = 0
+                mask = 0
+                for bit in subset:
+                    union |= positions[bit]
+                    mask |= bit
+                if self.POPCOUNTS[union] == n:
+                    points = [i for k, i in enumerate(unit) if union >> k & 1]
+                    if self._eliminate(masks, points, self.FULL_MASK & ~mask):
+                        return True
+        return False
+
+    def _hidden_pair(self, cells, masks):
+        return self._hidden_subset(cells, masks, 2)
+
+    def _hidden_triple(self, cells, masks):
+        return self._hidden_subset(cells, masks, 3)
+
+    def _fish(self, cells, masks, n):
+        """n rows whose candidates of a value lie in n columns
+        take that value from the rest of those columns, and vice versa.
+        """
+        for lines, cross_lines in ((self.ROWS, self.COLS), (self.COLS, self.ROWS)):
+            for bit in self.BITS[1:]:
+                # {line number: bitmask of the cross lines where bit is a candidate}
+                positions = {}
+                for l, line in enumerate(lines):
+                    position = 0
+                    for k, i in enumerate(line):
+                        if masks[i] & bit:
+                            position |= 1 << k
+                    if 2 <= self.POPCOUNTS[position] <= n:
+                        positions[l] = position
+                for subset in combinations(positions, n):
+                    union = 0
+                    for l in subset:
+                        union |= positions[l]
+                    if self.POPCOUNTS[union] != n:
+                        continue
+                    others = [
+                        i
+                        for k in range(9)
+                        if union >> k & 1
+                        for l, i in enumerate(cross_lines[k])
+                        if l not in subset
+                    ]
+                    if self._eliminate(masks, others, bit):
+                        return True
+        return False
+
+    def _x_wing(self, cells, masks):
+        return self._fish(cells, masks, 2)
+
+    def _swordfish(self, cells, masks):
+        return self._fish(cells, masks, 3)
+
+
+def test_sudoku_rating():
+    from sudoku_solver import SudokuBoard
+
+    rater = SudokuRater()
+    for sdm in [
+        "004006079000000602056092300078061030509000406020540890007410920105000000840600100",
+        "000000000000003085001020000000507000004000100090000000500000073002010000000040009",
+        "800000000003600000070090200050007000000045700000100030001000068008500010090000400",
+    ]:
+        print(sdm, rater.get_name(rater.rate(SudokuBoard(sdm))))
+
+
+if __name__ == "__main__":
+    test_sudoku_rating()
@@ -51,16 +51,40 @@ Hardest:
 """
 
 
-import asyncio
+import time
 
 
 class SudokuBoard:
+    """Sudoku board.
+
+    Besides the grid, the board keeps count of its empty points
+    and of the values used in each unit (rows 0-8, columns 9-17, blocks 18-26),
+    so is_finished(), is_valid() and is_solved() are O(1).
+    num_conflicts is the number of values used more than once in their units.
+    """
+
     FULL_SET = {i for i in range(1, 10)}
     EMPTY = 0
+    UNIT_NUMS = [
+        [(r, 9 + c, 18 + r // 3 * 3 + c // 3) for c in range(9)] for r in range(9)
+    ]
 
     def __init__(self, sdm):
         sdm = "".join(sdm.split())
         self.grid = [[int(sdm[r * 9 + c]) for c in range(9)] for r in range(9)]
+        self.num_empty = 0
+        self.num_conflicts = 0
+        self.unit_counts = [[0] * 10 for i in range(27)]
+        for r in range(9):
+            for c in range(9):
+                val = self.grid[r][c]
+                if val == self.EMPTY:
+                    self.num_empty += 1
+                    continue
+                for u in self.UNIT_NUMS[r][c]:
+                    if self.unit_counts[u][val]:
+                        self.num_conflicts += 1
+                    self.unit_counts[u][val] += 1
 
     def __repr__(self):
         return self.get_sdm()
@@ -87,6 +111,34 @@ class SudokuBoard:
     def __hash__(self) -> int:
         return hash(self.get_sdm())
 
+    def get_cell(self, r, c):
+        return self.grid[r][c]
+
+    def set_cell(self, r, c, val):
+        """Write a cell. All writes should go through here, not self.grid."""
+        old_val = self.grid[r][c]
+        if old_val == val:
+            return
+
+        units = self.UNIT_NUMS[r][c]
+        if old_val == self.EMPTY:
+            self.num_empty -= 1
+        else:
+            for u in units:
+                counts = self.unit_counts[u]
+                counts[old_val] -= 1
+                if counts[old_val]:
+                    self.num_conflicts -= 1
+        if val == self.EMPTY:
+            self.num_empty += 1
+        else:
+            for u in units:
+                counts = self.unit_counts[u]
+                if counts[val]:
+                    self.num_conflicts += 1
+                counts[val] += 1
+        self.grid[r][c] = val
+
     @staticmethod
     def get_block_num_from_position(r, c):
         return r // 3 * 3 + c // 3
@@ -137,7 +189,7 @@ class SudokuBoard:
         return target_r, target_c, target_possible_set
 
     def get_num_of_clues(self):
-        return [self.grid[r][c] != 0 for r in range(9) for c in range(9)].count(True)
+        return 81 - self.num_empty
 
     def get_difficulty_index(self):
         difficulty = 1
@@ -149,195 +201,630 @@ class SudokuBoard:
         return difficulty
 
     def is_valid(self):
-        for r in range(9):
-            row_list = [val for val in self.grid[r] if val != self.EMPTY]
-            row_set = set(row_list)
-            if row_set <= self.FULL_SET and len(row_set) != len(row_list):
-                return False
-
-        for c in range(9):
-            col_list = [
-                self.grid[r][c] for r in range(9) if self.grid[r][c] != self.EMPTY
-            ]
-            col_set = set(col_list)
-            if col_set <= self.FULL_SET and len(col_set) != len(col_list):
-                return False
-
-        for b in range(9):
-            r0, c0 = self.get_position_from_block_num(b)
-            block_list = [
-                self.grid[r0 + dr][c0 + dc]
-                for dr in range(3)
-                for dc in range(3)
-                if self.grid[r0 + dr][c0 + dc] != self.EMPTY
-            ]
-            block_set = set(block_list)
-            if block_set <= self.FULL_SET and len(block_set) != len(block_list):
-                return False
-
-        return True
+        return self.num_conflicts == 0
 
     def is_finished(self):
-        if str(self.EMPTY) in repr(self):
-            return False
-        return True
+        return self.num_empty == 0
 
     def is_solved(self):
-        if self.is_finished() and self.is_valid():
-            return True
-        return False
+        return self.num_empty == 0 and self.num_conflicts == 0
 
     def copy(self):
-        return SudokuBoard(self.get_sdm())
+        board = self.__class__.__new__(self.__class__)
+        board.grid = [row[:] for row in self.grid]
+        board.num_empty = self.num_empty
+        board.num_conflicts = self.num_conflicts
+        board.unit_counts = [counts[:] for counts in self.unit_counts]
+        return board
+
+
+class BitmaskSudokuBoard(SudokuBoard):
+    """Sudoku board with per row/column/block bitmasks of used values.
+
+    Bit (val - 1) of a mask is set when val is used in that unit.
+    The masks are kept up to date by set_cell(),
+    so looking up the candidates of a cell is O(1) and allocation free.
+    """
+
+    FULL_MASK = 0x1FF
+    MASK_SETS = [
+        frozenset(val for val in range(1, 10) if mask >> (val - 1) & 1)
+        for mask in range(0x200)
+    ]
+    MASK_SIZES = [len(vals) for vals in MASK_SETS]
+    BLOCK_NUMS = [[r // 3 * 3 + c // 3 for c in range(9)] for r in range(9)]
 
+    def __init__(self, sdm):
+        super().__init__(sdm)
+        self.row_masks = [0] * 9
+        self.col_masks = [0] * 9
+        self.block_masks = [0] * 9
+        for r in range(9):
+            for c in range(9):
+                val = self.grid[r][c]
+                if val != self.EMPTY:
+                    bit = 1 << (val - 1)
+                    self.row_masks[r] |= bit
+                    self.col_masks[c] |= bit
+                    self.block_masks[self.BLOCK_NUMS[r][c]] |= bit
+
+    def set_cell(self, r, c, val):
+        b = self.BLOCK_NUMS[r][c]
+        old_val = self.grid[r][c]
+        super().set_cell(r, c, val)
+        if old_val != self.EMPTY and old_val != val:
+            # A value leaves a unit's mask only when its last use there is gone.
+            keep = ~(1 << (old_val - 1))
+            if not self.unit_counts[r][old_val]:
+                self.row_masks[r] &= keep
+            if not self.unit_counts[9 + c][old_val]:
+                self.col_masks[c] &= keep
+            if not self.unit_counts[18 + b][old_val]:
+                self.block_masks[b] &= keep
+        if val != self.EMPTY:
+            bit = 1 << (val - 1)
+            self.row_masks[r] |= bit
+            self.col_masks[c] |= bit
+            self.block_masks[b] |= bit
 
-class SudokuSolver:
-    def _recur_solve_in_place(self, board, show_step=False):
-        """Recursively solve the board in place."""
-        if board.is_solved():
-            return board
+    def copy(self):
+        board = super().copy()
+        board.row_masks = self.row_masks[:]
+        board.col_masks = self.col_masks[:]
+        board.block_masks = self.block_masks[:]
+        return board
+
+    def get_candidate_mask(self, r, c):
+        return self.FULL_MASK & ~(
+            self.row_masks[r]
+            | self.col_masks[c]
+            | self.block_masks[self.BLOCK_NUMS[r][c]]
+        )
 
-        target_r, target_c, target_possible_set = board.get_target_unsolved_point()
-        if None in (target_r, target_c):
+    def get_possible_set(self, r, c):
+        if self.grid[r][c] != self.EMPTY:
             return None
+        return self.MASK_SETS[self.get_candidate_mask(r, c)] or None
 
-        if show_step:
-            print(repr(board))
-            print()
-            print(board)
-            print(target_r, target_c, target_possible_set)
-            input()
+    def get_target_unsolved_point(self):
+        """Return the empty point with the fewest candidates.
+
+        Unlike SudokuBoard, an empty point without any candidate
+        makes the board a dead end and (None, None, None) is returned at once.
+        """
+        full_mask = self.FULL_MASK
+        mask_sizes = self.MASK_SIZES
+        col_masks = self.col_masks
+        block_masks = self.block_masks
+        target_r = None
+        target_c = None
+        target_mask = 0
+        target_size = 10
 
-        for val in target_possible_set:
-            board.grid[target_r][target_c] = val
-            solution = self._recur_solve_in_place(board, show_step)
-            if solution is not None and solution.is_finished():
-                return solution
-            else:
-                board.grid[target_r][target_c] = SudokuBoard.EMPTY
+        for r in range(9):
+            row = self.grid[r]
+            row_mask = self.row_masks[r]
+            block_nums = self.BLOCK_NUMS[r]
+            for c in range(9):
+                if row[c] != self.EMPTY:
+                    continue
+                mask = full_mask & ~(
+                    row_mask | col_masks[c] | block_masks[block_nums[c]]
+                )
+                size = mask_sizes[mask]
+                if size < target_size:
+                    if size == 0:
+                        return None, None, None
+                    target_r, target_c = r, c
+                    target_mask = mask
+                    target_size = size
+                    if size == 1:
+                        return target_r, target_c, self.MASK_SETS[target_mask]
 
-        return None
+        if target_r is None:
+            return None, None, None
+        return target_r, target_c, self.MASK_SETS[target_mask]
 
-    def get_1_solution(self, board, show_step=False):
-        return self._recur_solve_in_place(board.copy(), show_step)
 
-    def _recur_get_all_solutions(self, board):
-        """Recursively get all solutions."""
-        if board.is_solved():
-            return [board.copy()]
+class CompactSudokuBoard:
+    """Compact sudoku board for holding many boards in sets and dicts.
 
-        target_r, target_c, target_possible_set = board.get_target_unsolved_point()
-        if None in (target_r, target_c):
-            return []
+    The cells are the 81 ASCII digits of the sdm in a bytearray,
+    so sdm bytes are taken as is, copy() is a buffer slice
+    and the hash is computed once until the next set_cell().
+    It has no unit counts nor candidates: convert it with to_board() to solve it.
+    """
 
-        all_solutions = []
-        for val in target_possible_set:
-            next_board = board.copy()
-            next_board.grid[target_r][target_c] = val
-            all_solutions += self._recur_get_all_solutions(next_board)
-        return all_solutions
+    __slots__ = ("cells", "_hash")
 
-    def get_all_solutions(self, board):
-        return self._recur_get_all_solutions(board)
+    ZERO = ord("0")
 
-    def _recur_at_most_1_solution(self, board):
-        # return (True, 0) or (True, 1) or (False, None)
-        if board.is_solved():
-            return (True, 1)
+    def __init__(self, sdm):
+        if isinstance(sdm, str):
+            sdm = sdm.encode("ascii")
+        if len(sdm) != 81:
+            sdm = b"".join(sdm.split())
+        self.cells = bytearray(sdm)
+        self._hash = None
 
-        target_r, target_c, target_possible_set = board.get_target_unsolved_point()
-        if None in (target_r, target_c):
-            return (True, 0)
+    @classmethod
+    def from_board(cls, board):
+        return cls(board.get_sdm())
 
-        solution_count = 0
-        for val in target_possible_set:
-            next_board = board.copy()
-            next_board.grid[target_r][target_c] = val
-            res, num = self._recur_at_most_1_solution(next_board)
-            if res:
-                solution_count += num
-                if solution_count > 1:
-                    return (False, None)
-            else:
-                return (False, None)
+    def to_board(self, board_class=BitmaskSudokuBoard):
+        return board_class(self.get_sdm())
 
-        return (True, solution_count)
+    def __repr__(self):
+        return self.get_sdm()
 
-    def at_most_1_solution(self, board):
-        return self._recur_at_most_1_solution(board)
+    def __eq__(self, __value: object) -> bool:
+        if not isinstance(__value, self.__class__):
+            raise ValueError(f"{__value} is not {self.__class__.__name__} instance.")
+        return self.cells == __value.cells
 
-    async def _async_recur_solve_in_place(self, board):
-        """Recursively solve the board in place."""
-        await asyncio.sleep(0)
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(bytes(self.cells))
+        return self._hash
 
-        if board.is_solved():
-            return board
+    def get_cell(self, r, c):
+        return self.cells[r * 9 + c] - self.ZERO
 
-        target_r, target_c, target_possible_set = board.get_target_unsolved_point()
-        if None in (target_r, target_c):
+    def set_cell(self, r, c, val):
+        """Write a cell. Do not change a board while it is in a set or dict."""
+        self.cells[r * 9 + c] = self.ZERO + val
+        self._hash = None
+
+    def get_sdm(self):
+        return self.cells.decode("ascii")
+
+    def get_num_of_clues(self):
+        return 81 - self.cells.count(self.ZERO)
+
+    def copy(self):
+        board = self.__class__.__new__(self.__class__)
+        board.cells = self.cells[:]
+        board._hash = self._hash
+        return board
+
+
+class SolutionCache:
+    """Least recently used cache of solutions, by puzzle sdm.
+
+    Pass it as the cache of solvers, which look puzzles up in it
+    before searching, and of generators, which put in it the solution
+    each puzzle is made from.
+    Only puzzles with a solution are cached. hits and misses count the lookups.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        # {puzzle sdm: solution sdm}, from the least to the most recently used.
+        self._solutions = {}
+
+    def __len__(self):
+        return len(self._solutions)
+
+    def get(self, sdm):
+        """Return the solution sdm of the puzzle sdm, or None if it is not cached."""
+        solution = self._solutions.pop(sdm, None)
+        if solution is None:
+            self.misses += 1
             return None
+        self.hits += 1
+        self._solutions[sdm] = solution
+        return solution
+
+    def put(self, sdm, solution):
+        self._solutions.pop(sdm, None)
+        self._solutions[sdm] = solution
+        if len(self._solutions) > self.maxsize:
+            del self._solutions[next(iter(self._solutions))]
+
+    def get_solution(self, board):
+        """Return the cached solution of the board as a board of its class, or None."""
+        solution = self.get(board.get_sdm())
+        return None if solution is None else board.__class__(solution)
+
+    def put_solution(self, board, solution):
+        self.put(board.get_sdm(), solution.get_sdm())
+
+    def clear(self):
+        self._solutions.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class YieldPolicy:
+    """When async searches yield to the event loop.
+
+    Yield every every_nodes nodes or every every_ms milliseconds,
+    whichever comes first. None disables that limit.
+    Searches are stepped step_nodes nodes at a time between checks.
+    A policy can be shared by several solvers and generators,
+    so that their nodes and time add up.
+    """
+
+    CHECK_NODES = 10
+
+    def __init__(self, every_nodes=50, every_ms=None):
+        self.every_nodes = every_nodes
+        self.every_ms = every_ms
+        if every_ms is None:
+            self.step_nodes = every_nodes
+        else:
+            self.step_nodes = min(every_nodes or self.CHECK_NODES, self.CHECK_NODES)
+        self._nodes = 0
+        self._last_time = time.time()
+
+    async def tick(self, nodes=1):
+        """Account for nodes visited, and yield to the event loop if it is due."""
+        self._nodes += nodes
+        if (self.every_nodes is not None and self._nodes >= self.every_nodes) or (
+            self.every_ms is not None
+            and (time.time() - self._last_time) * 1000 >= self.every_ms
+        ):
+            # Imported here rather than at the top, as the page itself never
+            # runs async searches and importing asyncio slows its startup.
+            import asyncio
 
-        for val in target_possible_set:
-            board.grid[target_r][target_c] = val
-            solution = await self._async_recur_solve_in_place(board)
-            if solution is not None and solution.is_finished():
-                return solution
-            else:
-                board.grid[target_r][target_c] = SudokuBoard.EMPTY
+            await asyncio.sleep(0)
+            self._nodes = 0
+            self._last_time = time.time()
 
-        return None
 
-    async def async_get_1_solution(self, board):
-        return await self._async_recur_solve_in_place(board.copy())
+class SearchStats:
+    """Counters of searches, collected when passed as stats to a solver.
+
+    The same instance can be passed to several calls to add them up.
+    phase_times maps a phase name to the seconds spent in it:
+    "copy": copying boards, "propagate": filling in singles,
+    "scan": looking for the target unsolved point, "step": the whole search.
+    """
 
-    async def _async_recur_get_all_solutions(self, board):
-        """Recursively get all solutions."""
-        await asyncio.sleep(0)
+    def __init__(self):
+        self.nodes = 0
+        self.backtracks = 0
+        self.max_depth = 0
+        self.candidate_scans = 0
+        self.board_copies = 0
+        self.phase_times = {}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.as_dict()})"
+
+    def add_time(self, phase, seconds):
+        self.phase_times[phase] = self.phase_times.get(phase, 0) + seconds
+
+    def as_dict(self):
+        return {
+            "nodes": self.nodes,
+            "backtracks": self.backtracks,
+            "max_depth": self.max_depth,
+            "candidate_scans": self.candidate_scans,
+            "board_copies": self.board_copies,
+            "phase_times": dict(self.phase_times),
+        }
+
+
+class SudokuSearch:
+    """Depth first search on a board with an explicit stack.
+
+    The board is searched in place, max_nodes nodes at a time,
+    so the search can be paused, resumed and cancelled between steps.
+    step() returns:
+    FOUND: the board holds a solution. Call step() again to continue.
+    PAUSED: max_nodes nodes have been visited. Call step() again to resume.
+    DONE: the search is finished.
+    CANCELLED: cancel() has been called.
+    If stats is a SearchStats, the search is counted into it.
+    """
+
+    FOUND = "found"
+    PAUSED = "paused"
+    DONE = "done"
+    CANCELLED = "cancelled"
+
+    def __init__(self, board, solver, show_step=False, stats=None):
+        self.board = board
+        self.solver = solver
+        self.show_step = show_step
+        self.stats = stats
+        self.nodes = 0
+        self.status = None
+        # Each frame is [r, c, vals, index of the next val, propagation trail].
+        # A solution is kept on the stack as a frame without a point.
+        self._stack = None
+
+    def _visit(self):
+        """Visit the node of the current board. Return True on a solution."""
+        board = self.board
+        stats = self.stats
+        self.nodes += 1
+        if stats is not None:
+            stats.nodes += 1
+            stats.max_depth = max(stats.max_depth, len(self._stack))
+            start_time = time.perf_counter()
+
+        trail = self.solver._propagate(board)
+        if stats is not None:
+            stats.add_time("propagate", time.perf_counter() - start_time)
+        if trail is None:
+            if stats is not None:
+                stats.backtracks += 1
+            return False
 
         if board.is_solved():
-            return [board.copy()]
+            self._stack.append([None, None, (), 0, trail])
+            return True
 
+        if stats is not None:
+            stats.candidate_scans += 1
+            start_time = time.perf_counter()
         target_r, target_c, target_possible_set = board.get_target_unsolved_point()
+        if stats is not None:
+            stats.add_time("scan", time.perf_counter() - start_time)
         if None in (target_r, target_c):
-            return []
+            self.solver._undo(board, trail)
+            if stats is not None:
+                stats.backtracks += 1
+            return False
 
-        all_solutions = []
-        for val in target_possible_set:
-            next_board = board.copy()
-            next_board.grid[target_r][target_c] = val
-            all_solutions += await self._async_recur_get_all_solutions(next_board)
-        return all_solutions
+        if self.show_step:
+            print(repr(board))
+            print()
+            print(board)
+            print(target_r, target_c, target_possible_set)
+            input()
 
-    async def async_get_all_solutions(self, board):
-        return await self._async_recur_get_all_solutions(board)
+        self._stack.append([target_r, target_c, tuple(target_possible_set), 0, trail])
+        return False
 
-    async def _async_recur_at_most_1_solution(self, board):
-        # return (True, 0) or (True, 1) or (False, None)
-        await asyncio.sleep(0)
+    def step(self, max_nodes=None):
+        if self.status in (self.DONE, self.CANCELLED):
+            return self.status
+
+        if self.stats is None:
+            return self._step(max_nodes)
+        start_time = time.perf_counter()
+        status = self._step(max_nodes)
+        self.stats.add_time("step", time.perf_counter() - start_time)
+        return status
+
+    def _step(self, max_nodes):
+        board = self.board
+        stack = self._stack
+        stop_nodes = None if max_nodes is None else self.nodes + max_nodes
+
+        if stack is None:
+            stack = self._stack = []
+            if not board.is_valid():
+                # Clashing clues, no need to search.
+                self.status = self.DONE
+                return self.status
+            if self._visit():
+                self.status = self.FOUND
+                return self.status
+
+        while stack:
+            if stop_nodes is not None and self.nodes >= stop_nodes:
+                self.status = self.PAUSED
+                return self.status
+
+            frame = stack[-1]
+            r, c, vals, i, trail = frame
+            if r is not None and i > 0:
+                board.set_cell(r, c, SudokuBoard.EMPTY)
+            if i == len(vals):
+                self.solver._undo(board, trail)
+                stack.pop()
+                continue
+
+            frame[3] = i + 1
+            board.set_cell(r, c, vals[i])
+            if self._visit():
+                self.status = self.FOUND
+                return self.status
+
+        self.status = self.DONE
+        return self.status
+
+    def cancel(self):
+        """Stop the search and restore the board."""
+        for r, c, vals, i, trail in reversed(self._stack or ()):
+            if r is not None and i > 0:
+                self.board.set_cell(r, c, SudokuBoard.EMPTY)
+            self.solver._undo(self.board, trail)
+        self._stack = []
+        self.status = self.CANCELLED
 
-        if board.is_solved():
-            return (True, 1)
 
-        target_r, target_c, target_possible_set = board.get_target_unsolved_point()
-        if None in (target_r, target_c):
-            return (True, 0)
+class SudokuSolver:
+    UNITS = (
+        [[(r, c) for c in range(9)] for r in range(9)]
+        + [[(r, c) for r in range(9)] for c in range(9)]
+        + [
+            [(b // 3 * 3 + i // 3, b % 3 * 3 + i % 3) for i in range(9)]
+            for b in range(9)
+        ]
+    )
+
+    def __init__(self, propagate=True, yield_policy=None, cache=None):
+        """cache is a SolutionCache for get_1_solution(), if given."""
+        self.propagate = propagate
+        self.yield_policy = yield_policy or YieldPolicy()
+        self.cache = cache
+
+    def _undo(self, board, trail):
+        for r, c in reversed(trail):
+            board.set_cell(r, c, SudokuBoard.EMPTY)
+
+    def _propagate(self, board):
+        """Fill in naked and hidden singles until nothing changes.
+
+        Return the list of filled points,
+        or None if a contradiction is found, in which case the board is restored.
+        """
+        trail = []
+        if not self.propagate:
+            return trail
+
+        progress = True
+        while progress:
+            progress = False
+
+            # Naked singles: an empty point with only 1 possible value.
+            for r in range(9):
+                for c in range(9):
+                    if board.get_cell(r, c) != SudokuBoard.EMPTY:
+                        continue
+                    possible_set = board.get_possible_set(r, c)
+                    if not possible_set:
+                        self._undo(board, trail)
+                        return None
+                    if len(possible_set) == 1:
+                        for val in possible_set:
+                            board.set_cell(r, c, val)
+                        trail.append((r, c))
+                        progress = True
+
+            # Hidden singles: a value with only 1 possible point in a unit.
+            for unit in self.UNITS:
+                used_set = set()
+                places = {}
+                for r, c in unit:
+                    val = board.get_cell(r, c)
+                    if val != SudokuBoard.EMPTY:
+                        used_set.add(val)
+                        continue
+                    for val in board.get_possible_set(r, c) or ():
+                        places.setdefault(val, []).append((r, c))
+
+                for val in SudokuBoard.FULL_SET - used_set:
+                    points = places.get(val)
+                    if not points:
+                        self._undo(board, trail)
+                        return None
+                    if len(points) == 1:
+                        r, c = points[0]
+                        possible_set = board.get_possible_set(r, c)
+                        if not possible_set or val not in possible_set:
+                            self._undo(board, trail)
+                            return None
+                        board.set_cell(r, c, val)
+                        trail.append((r, c))
+                        progress = True
+
+        return trail
+
+    def _copy(self, board, stats=None):
+        if stats is None:
+            return board.copy()
+        start_time = time.perf_counter()
+        board = board.copy()
+        stats.board_copies += 1
+        stats.add_time("copy", time.perf_counter() - start_time)
+        return board
+
+    def search(self, board, show_step=False, stats=None):
+        """Return a SudokuSearch on a copy of the board."""
+        return SudokuSearch(self._copy(board, stats), self, show_step, stats)
+
+    def get_1_solution(self, board, show_step=False, stats=None):
+        if self.cache is not None:
+            solution = self.cache.get_solution(board)
+            if solution is not None:
+                return solution
+        search = self.search(board, show_step, stats)
+        if search.step() == SudokuSearch.FOUND:
+            if self.cache is not None:
+                self.cache.put_solution(board, search.board)
+            return search.board
+        return None
 
+    def iter_solutions(self, board, limit=None, stats=None):
+        """Yield the solutions one by one as new boards, at most limit of them."""
+        search = self.search(board, stats=stats)
+        solution_count = 0
+        while limit is None or solution_count < limit:
+            if search.step() != SudokuSearch.FOUND:
+                return
+            solution_count += 1
+            yield self._copy(search.board, stats)
+
+    def count_solutions(self, board, limit=None, stats=None):
+        """Count the solutions, stopping at limit, without keeping any of them."""
+        search = self.search(board, stats=stats)
         solution_count = 0
-        for val in target_possible_set:
-            next_board = board.copy()
-            next_board.grid[target_r][target_c] = val
-            res, num = await self._async_recur_at_most_1_solution(next_board)
-            if res:
-                solution_count += num
-                if solution_count > 1:
-                    return (False, None)
-            else:
-                return (False, None)
+        while limit is None or solution_count < limit:
+            if search.step() != SudokuSearch.FOUND:
+                break
+            solution_count += 1
+        return solution_count
 
+    def get_all_solutions(self, board, limit=None, stats=None):
+        return list(self.iter_solutions(board, limit, stats))
+
+    def at_most_1_solution(self, board, stats=None):
+        # return (True, 0) or (True, 1) or (False, None)
+        solution_count = self.count_solutions(board, limit=2, stats=stats)
+        if solution_count > 1:
+            return (False, None)
         return (True, solution_count)
 
-    async def async_at_most_1_solution(self, board):
-        return await self._async_recur_at_most_1_solution(board)
+    async def _async_step(self, search):
+        """Step the search, yielding to the event loop as per self.yield_policy."""
+        while True:
+            nodes = search.nodes
+            status = search.step(self.yield_policy.step_nodes)
+            await self.yield_policy.tick(search.nodes - nodes)
+            if status != SudokuSearch.PAUSED:
+                return status
+
+    async def async_get_1_solution(self, board, stats=None):
+        if self.cache is not None:
+            solution = self.cache.get_solution(board)
+            if solution is not None:
+                return solution
+        search = self.search(board, stats=stats)
+        if await self._async_step(search) == SudokuSearch.FOUND:
+            if self.cache is not None:
+                self.cache.put_solution(board, search.board)
+            return search.board
+        return None
+
+    async def async_iter_solutions(self, board, limit=None, stats=None):
+        search = self.search(board, stats=stats)
+        solution_count = 0
+        while limit is None or solution_count < limit:
+            if await self._async_step(search) != SudokuSearch.FOUND:
+                return
+            solution_count += 1
+            yield self._copy(search.board, stats)
+
+    async def async_count_solutions(self, board, limit=None, stats=None):
+        search = self.search(board, stats=stats)
+        solution_count = 0
+        while limit is None or solution_count < limit:
+            if await self._async_step(search) != SudokuSearch.FOUND:
+                break
+            solution_count += 1
+        return solution_count
+
+    async def async_get_all_solutions(self, board, limit=None, stats=None):
+        return [
+            solution
+            async for solution in self.async_iter_solutions(board, limit, stats)
+        ]
+
+    async def async_at_most_1_solution(self, board, stats=None):
+        # return (True, 0) or (True, 1) or (False, None)
+        solution_count = await self.async_count_solutions(board, limit=2, stats=stats)
+        if solution_count > 1:
+            return (False, None)
+        return (True, solution_count)
 
 
 def test_sudoku_solver():
@@ -382,6 +869,8 @@ def test_sudoku_solver():
 
 
 async def async_test_sudoku_solver():
+    import asyncio
+
     env_dict = {}
     env_dict["end_event"] = asyncio.Event()
     env_dict["sec_count"] = 0
@@ -428,5 +917,7 @@ async def async_test_sudoku_solver():
 
 
 if __name__ == "__main__":
+    import asyncio
+
     # test_sudoku_solver()
     asyncio.run(async_test_sudoku_solver())
@@ -0,0 +1,210 @@
+"""Sudoku Symmetry.
+
+Transforms that turn a sudoku into an equivalent one,
+with the same number of solutions and the same difficulty:
+- relabeling the digits,
+- permuting the bands (groups of 3 rows) and the rows within each band,
+- permuting the stacks (groups of 3 columns) and the columns within each stack,
+- transposing.
+Together they make 9! * 6^8 * 2 (about 1.2 trillion) transforms.
+
+The canonical sdm of a puzzle is the smallest sdm among all its transforms,
+so 2 puzzles are equivalent if and only if their canonical sdms are equal.
+"""
+
+
+class SudokuTransform:
+    IDENTITY_POINTS = list(range(81))
+    IDENTITY_DIGITS = "0123456789"
+
+    def __init__(self, points=None, digits=None):
+        """Point i of a transformed sdm is digits[int(sdm[points[i]])]."""
+        self.points = points or self.IDENTITY_POINTS
+        self.digits = digits or self.IDENTITY_DIGITS
+
+    @classmethod
+    def from_permutations(cls, rows, cols, transpose=False, digits=None):
+        """Row r of the result is row rows[r] of the original,
+        and column c is column cols[c], before transposing.
+        """
+        if transpose:
+            points = [rows[r] * 9 + cols[c] for c in range(9) for r in range(9)]
+        else:
+            points = [rows[r] * 9 + cols[c] for r in range(9) for c in range(9)]
+        return cls(points, digits)
+
+    @staticmethod
+    def _random_lines(rng):
+        """Return a random permutation of 9 lines that keeps them in their band."""
+        bands = [0, 1, 2]
+        rng.shuffle(bands)
+        lines = []
+        for band in bands:
+            band_lines = [band * 3, band * 3 + 1, band * 3 + 2]
+            rng.shuffle(band_lines)
+            lines += band_lines
+        return lines
+
+    @classmethod
+    def random(cls, rng):
+        """rng is a random.Random or anything with its random() and shuffle()."""
+        digits = list("123456789")
+        rng.shuffle(digits)
+        return cls.from_permutations(
+            cls._random_lines(rng),
+            cls._random_lines(rng),
+            rng.random() < 0.5,
+            "0" + "".join(digits),
+        )
+
+    def apply(self, sdm):
+        sdm = "".join(sdm.split())
+        digits = self.digits
+        return "".join([digits[int(sdm[p])] for p in self.points])
+
+    def apply_board(self, board):
+        """Return the transformed board, of the same class."""
+        return board.__class__(self.apply(board.get_sdm()))
+
+
+# The 1296 permutations of 9 lines that keep them in their band (or stack),
+# built by get_canonical_sdm() on first use.
+LINE_PERMS = []
+
+# get_canonical_sdm() merges equivalent states when there are more of them.
+MAX_STATES = 4096
+
+
+def _relabel(vals, labels, next_label):
+    """Relabel the digits of vals by first appearance, extending labels.
+
+    Return (relabeled vals, next_label).
+    """
+    row = []
+    for val in vals:
+        if val and not labels[val]:
+            labels[val] = next_label
+            next_label += 1
+        row.append(labels[val])
+    return row, next_label
+
+
+def _get_state_key(g, cols, rows, labels):
+    """Return what the rows to come of a state depend on: the rows left,
+    with the digits labeled so far relabeled and the others as 10 + digit,
+    those left in the current band and those of each band left, in any order.
+    """
+
+    def get_row(r):
+        return tuple(labels[g[r][c]] or (10 + g[r][c] if g[r][c] else 0) for c in cols)
+
+    band = rows[-1] // 3
+    used_bands = {r // 3 for r in rows}
+    return (
+        tuple(
+            sorted(get_row(r) for r in range(band * 3, band * 3 + 3) if r not in rows)
+        ),
+        tuple(
+            sorted(
+                tuple(sorted(get_row(r) for r in range(b * 3, b * 3 + 3)))
+                for b in range(3)
+                if b not in used_bands
+            )
+        ),
+    )
+
+
+def get_canonical_sdm(sdm):
+    """Return the canonical sdm of the puzzle.
+
+    The grids are built row by row, keeping only the partial transforms
+    whose rows so far are the smallest, with digits relabeled by first appearance.
+    """
+    if not LINE_PERMS:
+        # Imported here, so that importing SudokuTransform does not import it.
+        from itertools import permutations, product
+
+        LINE_PERMS.extend(
+            tuple(band * 3 + i for band, perm in zip(bands, perms) for i in perm)
+            for bands in permutations(range(3))
+            for perms in product(permutations(range(3)), repeat=3)
+        )
+
+    sdm = "".join(sdm.split())
+    grid = [[int(sdm[r * 9 + c]) for c in range(9)] for r in range(9)]
+    grids = [grid, [list(col) for col in zip(*grid)]]
+
+    # Zeros sort first, so the first row must have the most zeros up front:
+    # only rows with the best zero counts per stack, sorted, can come first.
+    def zero_counts(row):
+        return sorted(row[s * 3 : s * 3 + 3].count(0) for s in range(3))[::-1]
+
+    best_counts = max(zero_counts(row) for g in grids for row in g)
+    first_rows = [
+        [r for r in range(9) if zero_counts(g[r]) == best_counts] for g in grids
+    ]
+
+    # A state is (grid number, column permutation, rows so far, labels, next label).
+    states = [(i, cols, (), [0] * 10, 1) for i in range(2) for cols in LINE_PERMS]
+    canonical_rows = []
+    for k in range(9):
+        next_states = []
+        best_row = None
+        for i, cols, rows, labels, next_label in states:
+            g = grids[i]
+            if k == 0:
+                choices = first_rows[i]
+            elif k % 3:
+                band = rows[-1] // 3
+                choices = [band * 3 + j for j in range(3) if band * 3 + j not in rows]
+            else:
+                used_bands = {r // 3 for r in rows}
+                choices = [r for r in range(9) if r // 3 not in used_bands]
+            for r in choices:
+                new_labels = labels[:]
+                row, new_next_label = _relabel(
+                    [g[r][c] for c in cols], new_labels, next_label
+                )
+                if best_row is None or row < best_row:
+                    best_row = row
+                    next_states = []
+                if row == best_row:
+                    next_states.append(
+                        (i, cols, rows + (r,), new_labels, new_next_label)
+                    )
+        if len(next_states) > MAX_STATES:
+            # States with the same key lead to the same rows,
+            # so only 1 of them is kept. Only near empty grids get here.
+            merged = {}
+            for state in next_states:
+                i, cols, rows, labels, next_label = state
+                merged.setdefault(_get_state_key(grids[i], cols, rows, labels), state)
+            next_states = list(merged.values())
+        states = next_states
+        canonical_rows.append(best_row)
+
+    return "".join(str(val) for row in canonical_rows for val in row)
+
+
+def test_sudoku_symmetry():
+    import random
+
+    from sudoku_solver import SudokuBoard, SudokuSolver
+
+    sdm = "004006079000000602056092300078061030509000406020540890007410920105000000840600100"
+    solver = SudokuSolver()
+    solution = solver.get_1_solution(SudokuBoard(sdm)).get_sdm()
+    for i in range(5):
+        transform = SudokuTransform.random(random)
+        variant = transform.apply(sdm)
+        print(variant)
+        assert solver.count_solutions(SudokuBoard(variant)) == 1
+        assert solver.get_1_solution(SudokuBoard(variant)).get_sdm() == (
+            transform.apply(solution)
+        )
+        assert get_canonical_sdm(variant) == get_canonical_sdm(sdm)
+    print(get_canonical_sdm(sdm))
+
+
+if __name__ == "__main__":
+    test_sudoku_symmetry()
@@ -0,0 +1,57 @@
+"""Sudoku Web Worker.
+
+Runs sudoku_solver and sudoku_generator in a Brython web worker,
+off the UI thread. Use it through sudoku_worker_client.SudokuWorkerClient.
+
+Requests, one at a time:
+[job_id, "generate", level]
+[job_id, "solve", sdm]
+
+Responses:
+[job_id, "progress", num_clues]  (generate only)
+[job_id, "result", sdm]          (sdm is None if there is no solution)
+[job_id, "error", message]
+"""
+
+from browser import bind, self  # type: ignore
+
+from sudoku_solver import BitmaskSudokuBoard, SudokuSolver, SolutionCache
+
+# Generated puzzles are put in it with their solutions, so solving them is instant.
+solution_cache = SolutionCache()
+
+
+def generate(job_id, level):
+    # Imported on the first generate job, so that the worker starts faster.
+    from sudoku_generator import SudokuGenerator
+
+    def progress(num_clues):
+        self.send([job_id, "progress", num_clues])
+
+    board = SudokuGenerator(cache=solution_cache).generate_level(
+        level=level, progress=progress
+    )
+    return board.get_sdm()
+
+
+def solve(job_id, sdm):
+    solver = SudokuSolver(cache=solution_cache)
+    solution = solver.get_1_solution(BitmaskSudokuBoard(sdm))
+    return None if solution is None else solution.get_sdm()
+
+
+COMMANDS = {
+    "generate": generate,
+    "solve": solve,
+}
+
+
+@bind(self, "message")
+def message(evt):
+    job_id, command, arg = evt.data
+    try:
+        result = COMMANDS[command](job_id, arg)
+    except Exception as e:
+        self.send([job_id, "error", f"{command} failed: {e!r}"])
+    else:
+        self.send([job_id, "result", result])
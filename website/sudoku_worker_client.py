@@ -0,0 +1,160 @@
+"""Sudoku Web Worker Client.
+
+Queues sudoku jobs for the web worker of sudoku_worker.py,
+which the page declares as:
+<script type="text/python" class="webworker" id="sudoku_worker"
+    src="sudoku_worker.py"></script>
+
+Jobs run one at a time in submission order.
+Cancelling the running job terminates the worker and starts a fresh one.
+
+If the worker fails to start, or does not start within STARTUP_TIMEOUT_MS,
+the client becomes unavailable: the pending jobs and any job submitted later
+fail through their on_error, so that the page can run them itself.
+"""
+
+from browser import timer, worker  # type: ignore
+
+
+class SudokuWorkerClient:
+    STARTUP_TIMEOUT_MS = 20000
+
+    def __init__(self, worker_id="sudoku_worker"):
+        self.worker_id = worker_id
+        self._worker = None
+        self._available = True
+        self._startup_timer = None
+        self._queue = []
+        self._current = None
+        self._next_job_id = 0
+        self._start_worker()
+
+    def _start_worker(self):
+        self._worker = None
+        self._clear_startup_timer()
+        self._startup_timer = timer.set_timeout(
+            self._on_startup_timeout, self.STARTUP_TIMEOUT_MS
+        )
+        try:
+            worker.create_worker(
+                self.worker_id, self._on_ready, self._on_message, self._on_error
+            )
+        except Exception as e:
+            self._fail_startup(f"The web worker could not be created: {e!r}")
+
+    def _clear_startup_timer(self):
+        if self._startup_timer is not None:
+            timer.clear_timeout(self._startup_timer)
+            self._startup_timer = None
+
+    def _on_ready(self, new_worker):
+        if not self._available:
+            new_worker.terminate()  # Ready too late, after the timeout.
+            return
+        self._clear_startup_timer()
+        self._worker = new_worker
+        self._run_next()
+
+    def _on_startup_timeout(self):
+        self._startup_timer = None
+        self._fail_startup("The web worker did not start in time.")
+
+    def _fail_startup(self, message):
+        """Make the client unavailable and fail all the pending jobs."""
+        self._available = False
+        self._clear_startup_timer()
+        jobs = self._queue if self._current is None else [self._current] + self._queue
+        self._queue = []
+        self._current = None
+        for job in jobs:
+            if job["on_error"] is not None:
+                job["on_error"](message)
+
+    def _run_next(self):
+        if self._worker is None or self._current is not None or not self._queue:
+            return
+        self._current = self._queue.pop(0)
+        self._worker.send(
+            [self._current["job_id"], self._current["command"], self._current["arg"]]
+        )
+
+    def _finish(self):
+        self._current = None
+        self._run_next()
+
+    def _on_message(self, evt):
+        job_id, kind, payload = evt.data
+        job = self._current
+        if job is None or job["job_id"] != job_id:
+            return  # A late message of a cancelled job.
+        if kind == "progress":
+            if job["on_progress"] is not None:
+                job["on_progress"](payload)
+        elif kind == "result":
+            self._finish()
+            job["on_result"](payload)
+        elif kind == "error":
+            self._finish()
+            if job["on_error"] is not None:
+                job["on_error"](payload)
+
+    def _on_error(self, evt):
+        message = str(getattr(evt, "message", evt))
+        if self._worker is None:
+            self._fail_startup(f"The web worker failed to start: {message}")
+            return
+        job = self._current
+        self._finish()
+        if job is not None and job["on_error"] is not None:
+            job["on_error"](message)
+
+    def submit(self, command, arg, on_result, on_progress=None, on_error=None):
+        """Queue a job. Return its job id for cancel().
+
+        If the client is not available, on_error is called at once instead.
+        """
+        job_id = self._next_job_id
+        self._next_job_id += 1
+        if not self._available:
+            if on_error is not None:
+                on_error("The web worker is not available.")
+            return job_id
+        self._queue.append(
+            {
+                "job_id": job_id,
+                "command": command,
+                "arg": arg,
+                "on_result": on_result,
+                "on_progress": on_progress,
+                "on_error": on_error,
+            }
+        )
+        self._run_next()
+        return job_id
+
+    def generate(self, level, on_result, on_progress=None, on_error=None):
+        """Generate a puzzle of the level. on_result(sdm) is called with it."""
+        return self.submit("generate", level, on_result, on_progress, on_error)
+
+    def solve(self, sdm, on_result, on_error=None):
+        """Solve the puzzle. on_result(sdm) is called with the solution or None."""
+        return self.submit("solve", sdm, on_result, None, on_error)
+
+    def is_available(self):
+        """Return False once the worker has failed to start."""
+        return self._available
+
+    def get_num_pending_jobs(self):
+        return len(self._queue) + (self._current is not None)
+
+    def cancel(self, job_id=None):
+        """Cancel a queued or running job, or all of them if job_id is None."""
+        self._queue = [
+            job for job in self._queue if job_id is not None and job["job_id"] != job_id
+        ]
+        if self._current is not None and job_id in (None, self._current["job_id"]):
+            self._current = None
+            if self._worker is not None:
+                self._worker.terminate()
+            if self._available:
+                self._start_worker()
@@ -0,0 +1,99 @@
+// Service worker caching the app for repeat visits and offline use.
+//
+// Each build has its own cache, named after BUILD_HASH,
+// which the publish workflow replaces with the commit hash.
+// Caches of other builds are deleted when a new build activates.
+//
+// Built pages serve assets, Python modules and the puzzle bank cache-first.
+// Unbuilt pages (BUILD_HASH left as is, e.g. while developing)
+// go network-first instead, so that edits show up, and fall back to the cache offline.
+//
+// To check it with a local static server:
+//   sed -i "s/__BUILD_HASH__/test1/" sw.js && python -m http.server
+// then load http://localhost:8000 twice, and look at the cached requests
+// and the offline mode in the Application tab of the browser devtools.
+
+const BUILD_HASH = "__BUILD_HASH__";
+const CACHE_PREFIX = "sudoku-";
+const CACHE_NAME = CACHE_PREFIX + BUILD_HASH;
+const IS_BUILT = BUILD_HASH !== "__BUILD_" + "HASH__";
+
+// Cached on install, those that exist. Others are cached the first time
+// they are fetched.
+const PRECACHE_URLS = [
+    "./",
+    "index.html",
+    "main.py",
+    "sudoku_bank.py",
+    "sudoku_generator.py",
+    "sudoku_rating.py",
+    "sudoku_solver.py",
+    "sudoku_symmetry.py",
+    "sudoku_worker.py",
+    "sudoku_worker_client.py",
+    "puzzle_bank.txt",
+    "assets/css/materialize_1.0.0.min.css",
+    "assets/img/favicon.ico",
+    "assets/js/brython_3.11.3.min.js",
+    "assets/js/brython_stdlib_3.11.3.min.js",  // Unbuilt pages.
+    "assets/js/brython_modules.js",  // Built pages.
+    "assets/js/brython.js",  // The web worker.
+    "assets/js/brython_stdlib.js",  // The web worker of unbuilt pages.
+    "assets/js/loader.js",
+    "assets/js/materialize_1.0.0.min.js",
+];
+
+self.addEventListener("install", (event) => {
+    // Each url is added on its own, so that a missing one does not fail the rest.
+    event.waitUntil(
+        caches.open(CACHE_NAME)
+            .then((cache) => Promise.all(
+                PRECACHE_URLS.map((url) => cache.add(url).catch(
+                    () => console.log("Not cached: " + url)
+                ))
+            ))
+            .then(() => self.skipWaiting())
+    );
+});
+
+self.addEventListener("activate", (event) => {
+    event.waitUntil(
+        caches.keys()
+            .then((names) => Promise.all(
+                names
+                    .filter((name) => name.startsWith(CACHE_PREFIX) && name !== CACHE_NAME)
+                    .map((name) => caches.delete(name))
+            ))
+            .then(() => self.clients.claim())
+    );
+});
+
+function fetch_and_cache(request) {
+    return fetch(request).then((response) => {
+        if (response.ok) {
+            const copy = response.clone();
+            caches.open(CACHE_NAME).then((cache) => cache.put(request, copy));
+        }
+        return response;
+    });
+}
+
+self.addEventListener("fetch", (event) => {
+    const request = event.request;
+    if (request.method !== "GET" || new URL(request.url).origin !== self.location.origin) {
+        return;
+    }
+    // Brython appends a query string to module urls to bypass the http cache.
+    const match_options = {ignoreSearch: true};
+    if (IS_BUILT) {
+        event.respondWith(
+            caches.match(request, match_options)
+                .then((cached) => cached || fetch_and_cache(request))
+        );
+    } else {
+        event.respondWith(
+            fetch_and_cache(request)
+                .catch(() => caches.match(request, match_options))
+        );
+    }
+});